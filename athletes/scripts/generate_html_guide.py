@@ -7,41 +7,73 @@ customized to the athlete's profile, race, and plan.
 """
 
 import yaml
+import io
 import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import date, datetime
+from html import escape
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, TextIO, Tuple
+
+# libyaml-backed loader when PyYAML was built with it; the pure-Python
+# SafeLoader dominates guide generation time otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# orjson parses plan_summary.json straight from bytes when it's installed
+try:
+    import orjson
+    _parse_json = orjson.loads
+except ImportError:
+    _parse_json = json.loads
+
+
+# =============================================================================
+# MINIFICATION
+# =============================================================================
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,])\s*', r'\1', css)
+    return re.sub(r':\s+', ':', css).strip()
+
+
+def _minify_js(js: str) -> str:
+    """Strip indentation, blank lines and whole-line comments from a script.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as
+    in the source.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith('//'))
 
 
 # =============================================================================
 # NEO-BRUTALIST HTML TEMPLATE
 # =============================================================================
 
-HTML_TEMPLATE = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Training Guide</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Sometype+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {{
+_CSS_RAW = '''
+        :root {
             --gg-bg: #ffffff;
             --gg-fg: #111111;
             --gg-border: #000000;
             --gg-muted: #666666;
             --gg-soft: #f5f5f5;
             --gg-accent: #000000;
-        }}
+        }
 
-        * {{
+        * {
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             margin: 0;
             padding: 32px 20px 64px 20px;
             max-width: 900px;
@@ -52,87 +84,87 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             font-size: 14px;
             line-height: 1.7;
             letter-spacing: 0.01em;
-        }}
+        }
 
         /* HEADER */
-        .guide-header {{
+        .guide-header {
             border-bottom: 3px solid var(--gg-border);
             padding-bottom: 16px;
             margin-bottom: 32px;
-        }}
+        }
 
-        .guide-header h1 {{
+        .guide-header h1 {
             font-size: 28px;
             font-weight: 700;
             text-transform: uppercase;
             letter-spacing: 0.15em;
             margin: 0 0 8px 0;
-        }}
+        }
 
-        .guide-subtitle {{
+        .guide-subtitle {
             font-size: 14px;
             text-transform: uppercase;
             letter-spacing: 0.12em;
             color: var(--gg-muted);
             margin: 0 0 12px 0;
-        }}
+        }
 
-        .guide-meta {{
+        .guide-meta {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
-        }}
+        }
 
-        .guide-meta span {{
+        .guide-meta span {
             display: inline-block;
             border: 1px solid var(--gg-border);
             padding: 4px 10px;
             font-size: 11px;
             text-transform: uppercase;
             letter-spacing: 0.1em;
-        }}
+        }
 
         /* TABLE OF CONTENTS */
-        .toc {{
+        .toc {
             border: 2px solid var(--gg-border);
             padding: 20px 24px;
             margin-bottom: 40px;
             background: var(--gg-soft);
-        }}
+        }
 
-        .toc h2 {{
+        .toc h2 {
             font-size: 12px;
             text-transform: uppercase;
             letter-spacing: 0.15em;
             margin: 0 0 16px 0;
             padding-bottom: 8px;
             border-bottom: 1px solid var(--gg-border);
-        }}
+        }
 
-        .toc ol {{
+        .toc ol {
             margin: 0;
             padding-left: 20px;
-        }}
+        }
 
-        .toc li {{
+        .toc li {
             margin-bottom: 6px;
-        }}
+        }
 
-        .toc a {{
+        .toc a {
             color: var(--gg-fg);
             text-decoration: none;
-        }}
+        }
 
-        .toc a:hover {{
+        .toc a:hover {
             text-decoration: underline;
-        }}
+        }
 
         /* SECTIONS */
-        section {{
+        section {
             margin-bottom: 48px;
-        }}
+        }
 
-        h2 {{
+        h2 {
             font-size: 18px;
             font-weight: 600;
             text-transform: uppercase;
@@ -140,97 +172,97 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             margin: 0 0 20px 0;
             padding-bottom: 8px;
             border-bottom: 2px solid var(--gg-border);
-        }}
+        }
 
-        h3 {{
+        h3 {
             font-size: 13px;
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.1em;
             color: var(--gg-muted);
             margin: 24px 0 12px 0;
-        }}
+        }
 
-        h4 {{
+        h4 {
             font-size: 12px;
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.08em;
             margin: 20px 0 10px 0;
-        }}
+        }
 
-        p {{
+        p {
             margin: 0 0 16px 0;
-        }}
+        }
 
-        strong {{
+        strong {
             font-weight: 600;
-        }}
+        }
 
-        ul, ol {{
+        ul, ol {
             margin: 0 0 16px 0;
             padding-left: 24px;
-        }}
+        }
 
-        li {{
+        li {
             margin-bottom: 6px;
-        }}
+        }
 
         /* CALLOUT BOXES */
-        .callout {{
+        .callout {
             border: 2px solid var(--gg-border);
             border-left-width: 6px;
             padding: 16px 20px;
             margin: 20px 0;
             background: var(--gg-soft);
-        }}
+        }
 
-        .callout.alert {{
+        .callout.alert {
             border-left-color: #000;
             background: #f0f0f0;
-        }}
+        }
 
-        .callout.info {{
+        .callout.info {
             border-left-color: #666;
-        }}
+        }
 
-        .callout.tip {{
+        .callout.tip {
             border-style: dashed;
-        }}
+        }
 
-        .callout h4 {{
+        .callout h4 {
             margin-top: 0;
-        }}
+        }
 
         /* TABLES */
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 16px 0 24px 0;
             font-size: 13px;
-        }}
+        }
 
-        th, td {{
+        th, td {
             border: 1px solid var(--gg-border);
             padding: 8px 12px;
             text-align: left;
             vertical-align: top;
-        }}
+        }
 
-        th {{
+        th {
             background: #f0f0f0;
             font-weight: 600;
             text-transform: uppercase;
             font-size: 11px;
             letter-spacing: 0.08em;
-        }}
+        }
 
-        tbody tr:nth-child(even) {{
+        tbody tr:nth-child(even) {
             background: #fafafa;
-        }}
+        }
 
         /* KEY INDICATOR */
-        .key-day {{
+        .key-day {
             display: inline-block;
             background: #000;
             color: #fff;
@@ -239,16 +271,16 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             text-transform: uppercase;
             letter-spacing: 0.05em;
             margin-left: 6px;
-        }}
+        }
 
         /* PHASE CARDS */
-        .phase-card {{
+        .phase-card {
             border: 2px solid var(--gg-border);
             margin: 16px 0;
             background: #fff;
-        }}
+        }
 
-        .phase-card-header {{
+        .phase-card-header {
             background: #000;
             color: #fff;
             padding: 12px 16px;
@@ -256,86 +288,86 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             text-transform: uppercase;
             letter-spacing: 0.1em;
             font-size: 13px;
-        }}
+        }
 
-        .phase-card-body {{
+        .phase-card-body {
             padding: 16px;
-        }}
+        }
 
-        .phase-card-body p {{
+        .phase-card-body p {
             margin: 0 0 8px 0;
-        }}
+        }
 
-        .phase-card-body ul {{
+        .phase-card-body ul {
             margin: 8px 0 0 0;
-        }}
+        }
 
         /* QUICK STATS */
-        .quick-stats {{
+        .quick-stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 12px;
             margin: 20px 0;
-        }}
+        }
 
-        .stat-box {{
+        .stat-box {
             border: 2px solid var(--gg-border);
             padding: 16px;
             text-align: center;
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 24px;
             font-weight: 700;
             display: block;
             margin-bottom: 4px;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-size: 10px;
             text-transform: uppercase;
             letter-spacing: 0.1em;
             color: var(--gg-muted);
-        }}
+        }
 
         /* CHECKLIST */
-        .checklist {{
+        .checklist {
             list-style: none;
             padding: 0;
-        }}
+        }
 
-        .checklist li {{
+        .checklist li {
             display: flex;
             align-items: flex-start;
             gap: 10px;
             margin-bottom: 8px;
-        }}
+        }
 
-        .checklist input[type="checkbox"] {{
+        .checklist input[type="checkbox"] {
             width: 18px;
             height: 18px;
             margin-top: 2px;
             cursor: pointer;
-        }}
+        }
 
         /* ZONE TABLE */
-        .zone-row-gspot {{
+        .zone-row-gspot {
             background: #e8f5e9 !important;
-        }}
+        }
 
         /* TIMELINE */
-        .timeline {{
+        .timeline {
             border-left: 3px solid var(--gg-border);
             margin: 20px 0 20px 12px;
             padding-left: 24px;
-        }}
+        }
 
-        .timeline-item {{
+        .timeline-item {
             position: relative;
             margin-bottom: 20px;
-        }}
+        }
 
-        .timeline-item::before {{
+        .timeline-item::before {
             content: '';
             position: absolute;
             left: -30px;
@@ -344,84 +376,84 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             height: 12px;
             background: #000;
             border-radius: 50%;
-        }}
+        }
 
-        .timeline-time {{
+        .timeline-time {
             font-weight: 600;
             font-size: 12px;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
+        }
 
         /* DECISION TREE */
-        .decision-tree {{
+        .decision-tree {
             border: 2px solid var(--gg-border);
             padding: 20px;
             margin: 20px 0;
-        }}
+        }
 
-        .decision-tree h4 {{
+        .decision-tree h4 {
             margin-top: 0;
             padding-bottom: 8px;
             border-bottom: 1px solid var(--gg-border);
-        }}
+        }
 
-        .decision-tree ol {{
+        .decision-tree ol {
             margin-bottom: 0;
-        }}
+        }
 
         /* FOOTER */
-        .guide-footer {{
+        .guide-footer {
             border-top: 3px solid var(--gg-border);
             padding-top: 24px;
             margin-top: 48px;
             text-align: center;
-        }}
+        }
 
-        .guide-footer p {{
+        .guide-footer p {
             font-size: 16px;
             font-weight: 600;
-        }}
+        }
 
         /* PRINT STYLES */
-        @media print {{
-            body {{
+        @media print {
+            body {
                 font-size: 12px;
-            }}
-            .toc {{
+            }
+            .toc {
                 page-break-after: always;
-            }}
-            section {{
+            }
+            section {
                 page-break-inside: avoid;
-            }}
-        }}
+            }
+        }
 
         /* RESPONSIVE */
-        @media (max-width: 600px) {{
-            .guide-header h1 {{
+        @media (max-width: 600px) {
+            .guide-header h1 {
                 font-size: 22px;
-            }}
-            .quick-stats {{
+            }
+            .quick-stats {
                 grid-template-columns: 1fr 1fr;
-            }}
-        }}
+            }
+        }
 
         /* RACE TIMELINE */
-        .race-timeline {{
+        .race-timeline {
             position: relative;
             padding: 20px 0;
             margin: 24px 0;
-        }}
+        }
 
-        .timeline-track {{
+        .timeline-track {
             position: relative;
             height: 60px;
             background: linear-gradient(to right, #f0f0f0 0%, #e0e0e0 100%);
             border: 2px solid var(--gg-border);
             margin-bottom: 20px;
-        }}
+        }
 
-        .timeline-labels {{
+        .timeline-labels {
             display: flex;
             justify-content: space-between;
             font-size: 10px;
@@ -429,16 +461,16 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             letter-spacing: 0.08em;
             color: var(--gg-muted);
             margin-bottom: 8px;
-        }}
+        }
 
-        .timeline-event {{
+        .timeline-event {
             position: absolute;
             top: -8px;
             transform: translateX(-50%);
             text-align: center;
-        }}
+        }
 
-        .timeline-event .marker {{
+        .timeline-event .marker {
             width: 24px;
             height: 24px;
             border: 3px solid #000;
@@ -450,27 +482,27 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             font-size: 11px;
             font-weight: 700;
             margin: 0 auto 4px auto;
-        }}
+        }
 
-        .timeline-event.a-event .marker {{
+        .timeline-event.a-event .marker {
             background: #000;
             color: #fff;
             width: 32px;
             height: 32px;
             font-size: 14px;
-        }}
+        }
 
-        .timeline-event.b-event .marker {{
+        .timeline-event.b-event .marker {
             background: #666;
             color: #fff;
-        }}
+        }
 
-        .timeline-event.c-event .marker {{
+        .timeline-event.c-event .marker {
             background: #fff;
             color: #000;
-        }}
+        }
 
-        .timeline-event .event-name {{
+        .timeline-event .event-name {
             font-size: 10px;
             font-weight: 600;
             text-transform: uppercase;
@@ -479,79 +511,79 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             white-space: nowrap;
             overflow: hidden;
             text-overflow: ellipsis;
-        }}
+        }
 
-        .timeline-event .event-date {{
+        .timeline-event .event-date {
             font-size: 9px;
             color: var(--gg-muted);
-        }}
+        }
 
-        .event-legend {{
+        .event-legend {
             display: flex;
             gap: 24px;
             justify-content: center;
             margin-top: 16px;
             font-size: 11px;
-        }}
+        }
 
-        .event-legend span {{
+        .event-legend span {
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
+        }
 
-        .legend-dot {{
+        .legend-dot {
             width: 12px;
             height: 12px;
             border: 2px solid #000;
             border-radius: 50%;
-        }}
+        }
 
-        .legend-dot.a {{ background: #000; }}
-        .legend-dot.b {{ background: #666; }}
-        .legend-dot.c {{ background: #fff; }}
+        .legend-dot.a { background: #000; }
+        .legend-dot.b { background: #666; }
+        .legend-dot.c { background: #fff; }
 
         /* GOALS */
-        .goal-card {{
+        .goal-card {
             border: 2px solid var(--gg-border);
             padding: 16px 20px;
             margin: 12px 0;
             display: flex;
             gap: 16px;
             align-items: flex-start;
-        }}
+        }
 
-        .goal-icon {{
+        .goal-icon {
             font-size: 24px;
             flex-shrink: 0;
-        }}
+        }
 
-        .goal-content h4 {{
+        .goal-content h4 {
             margin: 0 0 4px 0;
-        }}
+        }
 
-        .goal-content p {{
+        .goal-content p {
             margin: 0;
             color: var(--gg-muted);
             font-size: 13px;
-        }}
+        }
 
         /* PHILOSOPHY */
-        .philosophy-framework {{
+        .philosophy-framework {
             border: 2px solid var(--gg-border);
             padding: 24px;
             margin: 20px 0;
             background: var(--gg-soft);
-        }}
+        }
 
-        .philosophy-diagram {{
+        .philosophy-diagram {
             display: flex;
             justify-content: center;
             gap: 8px;
             margin: 20px 0;
-        }}
+        }
 
-        .philosophy-bar {{
+        .philosophy-bar {
             height: 40px;
             display: flex;
             align-items: center;
@@ -560,70 +592,70 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
+        }
 
-        .bar-easy {{
+        .bar-easy {
             background: #e0e0e0;
             border: 2px solid #000;
-        }}
+        }
 
-        .bar-hard {{
+        .bar-hard {
             background: #000;
             color: #fff;
-        }}
+        }
 
         /* BLINDSPOTS */
-        .blindspot {{
+        .blindspot {
             border: 2px solid var(--gg-border);
             border-left-width: 8px;
             padding: 16px 20px;
             margin: 16px 0;
             background: #fff;
-        }}
+        }
 
-        .blindspot.high {{
+        .blindspot.high {
             border-left-color: #000;
             background: #f5f5f5;
-        }}
+        }
 
-        .blindspot.medium {{
+        .blindspot.medium {
             border-left-color: #666;
-        }}
+        }
 
-        .blindspot.low {{
+        .blindspot.low {
             border-left-color: #ccc;
-        }}
+        }
 
-        .blindspot-header {{
+        .blindspot-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 8px;
-        }}
+        }
 
-        .blindspot-header h4 {{
+        .blindspot-header h4 {
             margin: 0;
-        }}
+        }
 
-        .blindspot-severity {{
+        .blindspot-severity {
             font-size: 10px;
             text-transform: uppercase;
             letter-spacing: 0.1em;
             padding: 2px 8px;
             border: 1px solid currentColor;
-        }}
+        }
 
         /* ATP TABLE - IMPROVED READABILITY */
-        .atp-container {{
+        .atp-container {
             margin: 24px 0;
-        }}
+        }
 
-        .atp-week {{
+        .atp-week {
             border: 2px solid var(--gg-border);
             margin-bottom: -2px;
-        }}
+        }
 
-        .atp-week-header {{
+        .atp-week-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -631,72 +663,72 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             background: var(--gg-soft);
             cursor: pointer;
             user-select: none;
-        }}
+        }
 
-        .atp-week-header:hover {{
+        .atp-week-header:hover {
             background: #e8e8e8;
-        }}
+        }
 
-        .atp-week-title {{
+        .atp-week-title {
             display: flex;
             align-items: center;
             gap: 12px;
-        }}
+        }
 
-        .atp-week-num {{
+        .atp-week-num {
             font-weight: 700;
             font-size: 14px;
-        }}
+        }
 
-        .atp-week-phase {{
+        .atp-week-phase {
             font-size: 10px;
             text-transform: uppercase;
             letter-spacing: 0.1em;
             padding: 2px 8px;
             background: #000;
             color: #fff;
-        }}
+        }
 
-        .atp-week-phase.base {{ background: #888; }}
-        .atp-week-phase.build {{ background: #444; }}
-        .atp-week-phase.peak {{ background: #000; }}
-        .atp-week-phase.taper {{ background: #aaa; color: #000; }}
+        .atp-week-phase.base { background: #888; }
+        .atp-week-phase.build { background: #444; }
+        .atp-week-phase.peak { background: #000; }
+        .atp-week-phase.taper { background: #aaa; color: #000; }
 
-        .atp-week-meta {{
+        .atp-week-meta {
             display: flex;
             gap: 16px;
             font-size: 11px;
             color: var(--gg-muted);
-        }}
+        }
 
-        .atp-week-toggle {{
+        .atp-week-toggle {
             font-size: 18px;
             font-weight: 700;
             transition: transform 0.2s;
-        }}
+        }
 
-        .atp-week.open .atp-week-toggle {{
+        .atp-week.open .atp-week-toggle {
             transform: rotate(45deg);
-        }}
+        }
 
-        .atp-week-content {{
+        .atp-week-content {
             display: none;
             padding: 16px 20px;
             border-top: 1px solid var(--gg-border);
-        }}
+        }
 
-        .atp-week.open .atp-week-content {{
+        .atp-week.open .atp-week-content {
             display: block;
-        }}
+        }
 
-        .atp-workouts {{
+        .atp-workouts {
             display: grid;
             grid-template-columns: repeat(7, 1fr);
             gap: 8px;
             margin: 16px 0;
-        }}
+        }
 
-        .atp-day {{
+        .atp-day {
             border: 2px solid var(--gg-border);
             padding: 10px;
             font-size: 12px;
@@ -704,15 +736,15 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             background: #fff;
             cursor: pointer;
             transition: all 0.15s ease;
-        }}
+        }
 
-        .atp-day:hover {{
+        .atp-day:hover {
             background: #f5f5f5;
             transform: translateY(-2px);
             box-shadow: 2px 2px 0 #000;
-        }}
+        }
 
-        .atp-day-name {{
+        .atp-day-name {
             font-weight: 700;
             text-transform: uppercase;
             font-size: 11px;
@@ -721,66 +753,66 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             padding-bottom: 6px;
             border-bottom: 1px solid #ddd;
             color: #333;
-        }}
+        }
 
-        .atp-day.key-day {{
+        .atp-day.key-day {
             background: #000;
             color: #fff;
-        }}
+        }
 
-        .atp-day.key-day .atp-day-name {{
+        .atp-day.key-day .atp-day-name {
             color: #fff;
             border-bottom-color: #444;
-        }}
+        }
 
-        .atp-day.key-day .atp-workout-item {{
+        .atp-day.key-day .atp-workout-item {
             color: #fff;
-        }}
+        }
 
-        .atp-day.strength-day {{
+        .atp-day.strength-day {
             background: #f0f0f0;
             border-style: dashed;
-        }}
+        }
 
-        .atp-day.strength-day .atp-day-name {{
+        .atp-day.strength-day .atp-day-name {
             color: #666;
-        }}
+        }
 
-        .atp-workout-item {{
+        .atp-workout-item {
             margin: 6px 0;
             font-size: 11px;
             font-weight: 500;
             color: #333;
-        }}
+        }
 
-        .atp-workout-item.strength {{
+        .atp-workout-item.strength {
             color: #666;
             font-weight: 600;
             display: flex;
             align-items: center;
             gap: 4px;
-        }}
+        }
 
-        .atp-workout-item.strength::before {{
+        .atp-workout-item.strength::before {
             content: '💪';
             font-size: 12px;
-        }}
+        }
 
-        .atp-focus {{
+        .atp-focus {
             margin-top: 16px;
             padding-top: 12px;
             border-top: 1px dashed var(--gg-border);
             font-size: 13px;
-        }}
+        }
 
-        .atp-focus strong {{
+        .atp-focus strong {
             text-transform: uppercase;
             font-size: 11px;
             letter-spacing: 0.05em;
-        }}
+        }
 
         /* WORKOUT MODAL */
-        .workout-modal {{
+        .workout-modal {
             display: none;
             position: fixed;
             top: 0;
@@ -791,13 +823,13 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             z-index: 1000;
             justify-content: center;
             align-items: center;
-        }}
+        }
 
-        .workout-modal.open {{
+        .workout-modal.open {
             display: flex;
-        }}
+        }
 
-        .workout-modal-content {{
+        .workout-modal-content {
             background: #fff;
             border: 3px solid #000;
             max-width: 600px;
@@ -805,25 +837,25 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             max-height: 80vh;
             overflow-y: auto;
             padding: 24px;
-        }}
+        }
 
-        .workout-modal-header {{
+        .workout-modal-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 16px;
             padding-bottom: 12px;
             border-bottom: 2px solid #000;
-        }}
+        }
 
-        .workout-modal-header h3 {{
+        .workout-modal-header h3 {
             margin: 0;
             font-size: 16px;
             text-transform: uppercase;
             letter-spacing: 0.1em;
-        }}
+        }
 
-        .workout-modal-close {{
+        .workout-modal-close {
             background: #000;
             color: #fff;
             border: none;
@@ -832,35 +864,35 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             font-size: 18px;
             cursor: pointer;
             font-family: inherit;
-        }}
+        }
 
-        .workout-modal-close:hover {{
+        .workout-modal-close:hover {
             background: #333;
-        }}
+        }
 
-        .workout-detail {{
+        .workout-detail {
             margin: 12px 0;
-        }}
+        }
 
-        .workout-detail-label {{
+        .workout-detail-label {
             font-size: 10px;
             text-transform: uppercase;
             letter-spacing: 0.1em;
             color: #666;
             margin-bottom: 4px;
-        }}
+        }
 
         /* RACE ACCORDION */
-        .race-accordion {{
+        .race-accordion {
             margin: 20px 0;
-        }}
+        }
 
-        .race-accordion-item {{
+        .race-accordion-item {
             border: 2px solid var(--gg-border);
             margin-bottom: -2px;
-        }}
+        }
 
-        .race-accordion-header {{
+        .race-accordion-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -868,19 +900,19 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             cursor: pointer;
             background: #fff;
             transition: background 0.15s;
-        }}
+        }
 
-        .race-accordion-header:hover {{
+        .race-accordion-header:hover {
             background: #f5f5f5;
-        }}
+        }
 
-        .race-accordion-title {{
+        .race-accordion-title {
             display: flex;
             align-items: center;
             gap: 16px;
-        }}
+        }
 
-        .race-priority {{
+        .race-priority {
             width: 32px;
             height: 32px;
             border: 3px solid #000;
@@ -890,136 +922,136 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             justify-content: center;
             font-weight: 700;
             font-size: 14px;
-        }}
+        }
 
-        .race-priority.a {{ background: #000; color: #fff; }}
-        .race-priority.b {{ background: #666; color: #fff; }}
-        .race-priority.c {{ background: #fff; color: #000; }}
+        .race-priority.a { background: #000; color: #fff; }
+        .race-priority.b { background: #666; color: #fff; }
+        .race-priority.c { background: #fff; color: #000; }
 
-        .race-name {{
+        .race-name {
             font-weight: 600;
             font-size: 14px;
-        }}
+        }
 
-        .race-date {{
+        .race-date {
             font-size: 12px;
             color: #666;
-        }}
+        }
 
-        .race-accordion-toggle {{
+        .race-accordion-toggle {
             font-size: 20px;
             font-weight: 700;
             transition: transform 0.2s;
-        }}
+        }
 
-        .race-accordion-item.open .race-accordion-toggle {{
+        .race-accordion-item.open .race-accordion-toggle {
             transform: rotate(45deg);
-        }}
+        }
 
-        .race-accordion-content {{
+        .race-accordion-content {
             display: none;
             padding: 20px;
             border-top: 1px solid var(--gg-border);
             background: #f9f9f9;
-        }}
+        }
 
-        .race-accordion-item.open .race-accordion-content {{
+        .race-accordion-item.open .race-accordion-content {
             display: block;
-        }}
+        }
 
-        .race-details-grid {{
+        .race-details-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 16px;
-        }}
+        }
 
-        .race-detail {{
+        .race-detail {
             background: #fff;
             border: 1px solid #ddd;
             padding: 12px;
-        }}
+        }
 
-        .race-detail-label {{
+        .race-detail-label {
             font-size: 10px;
             text-transform: uppercase;
             letter-spacing: 0.08em;
             color: #666;
             margin-bottom: 4px;
-        }}
+        }
 
-        .race-detail-value {{
+        .race-detail-value {
             font-size: 14px;
             font-weight: 600;
-        }}
+        }
 
         /* NUTRITION SECTION */
-        .nutrition-calc {{
+        .nutrition-calc {
             border: 2px solid var(--gg-border);
             padding: 20px;
             margin: 20px 0;
             background: var(--gg-soft);
-        }}
+        }
 
-        .nutrition-macros {{
+        .nutrition-macros {
             display: grid;
             grid-template-columns: repeat(4, 1fr);
             gap: 12px;
             margin: 16px 0;
-        }}
+        }
 
-        .macro-box {{
+        .macro-box {
             border: 2px solid var(--gg-border);
             padding: 16px;
             text-align: center;
             background: #fff;
-        }}
+        }
 
-        .macro-value {{
+        .macro-value {
             font-size: 28px;
             font-weight: 700;
             display: block;
-        }}
+        }
 
-        .macro-unit {{
+        .macro-unit {
             font-size: 12px;
             color: #666;
-        }}
+        }
 
-        .macro-label {{
+        .macro-label {
             font-size: 10px;
             text-transform: uppercase;
             letter-spacing: 0.1em;
             color: #666;
             margin-top: 4px;
-        }}
+        }
 
         /* INTERACTIVE SLIDER */
-        .slider-container {{
+        .slider-container {
             margin: 20px 0;
             padding: 20px;
             border: 2px solid var(--gg-border);
             background: #fff;
-        }}
+        }
 
-        .slider-group {{
+        .slider-group {
             margin: 16px 0;
-        }}
+        }
 
-        .slider-label {{
+        .slider-label {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 8px;
             font-size: 13px;
             font-weight: 600;
-        }}
+        }
 
-        .slider-value {{
+        .slider-value {
             font-weight: 700;
             color: #000;
-        }}
+        }
 
-        .slider {{
+        .slider {
             width: 100%;
             height: 8px;
             -webkit-appearance: none;
@@ -1027,27 +1059,27 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             background: #ddd;
             outline: none;
             border: 2px solid #000;
-        }}
+        }
 
-        .slider::-webkit-slider-thumb {{
+        .slider::-webkit-slider-thumb {
             -webkit-appearance: none;
             appearance: none;
             width: 20px;
             height: 20px;
             background: #000;
             cursor: pointer;
-        }}
+        }
 
-        .slider::-moz-range-thumb {{
+        .slider::-moz-range-thumb {
             width: 20px;
             height: 20px;
             background: #000;
             cursor: pointer;
             border: none;
-        }}
+        }
 
         /* ZWO PARSER */
-        .zwo-upload {{
+        .zwo-upload {
             border: 2px dashed var(--gg-border);
             padding: 24px;
             margin: 20px 0;
@@ -1055,237 +1087,1007 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             background: #f9f9f9;
             cursor: pointer;
             transition: all 0.2s;
-        }}
+        }
 
-        .zwo-upload:hover {{
+        .zwo-upload:hover {
             background: #f0f0f0;
             border-color: #000;
-        }}
+        }
 
-        .zwo-upload.dragover {{
+        .zwo-upload.dragover {
             background: #e8e8e8;
             border-color: #000;
             border-style: solid;
-        }}
+        }
 
-        .zwo-file-input {{
+        .zwo-file-input {
             display: none;
-        }}
+        }
 
-        .zwo-results {{
+        .zwo-results {
             display: none;
             margin-top: 20px;
             padding: 20px;
             border: 2px solid var(--gg-border);
             background: #fff;
-        }}
+        }
 
-        .zwo-results.show {{
+        .zwo-results.show {
             display: block;
-        }}
+        }
 
-        .zwo-workout-info {{
+        .zwo-workout-info {
             margin-bottom: 16px;
             padding-bottom: 16px;
             border-bottom: 1px solid #ddd;
-        }}
+        }
 
-        .zwo-workout-title {{
+        .zwo-workout-title {
             font-size: 16px;
             font-weight: 700;
             margin-bottom: 8px;
-        }}
+        }
 
-        .zwo-macros {{
+        .zwo-macros {
             display: grid;
             grid-template-columns: repeat(4, 1fr);
             gap: 12px;
             margin: 16px 0;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            .atp-workouts {{
+        @media (max-width: 768px) {
+            .atp-workouts {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-            .nutrition-macros {{
+            }
+            .nutrition-macros {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
+            }
+        }
 
-        @media (max-width: 480px) {{
-            .atp-workouts {{
+        @media (max-width: 480px) {
+            .atp-workouts {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
+'''
+
+# Minified once at import; renders write the smaller copy as part of _HEAD
+_CSS_MIN = _minify_css(_CSS_RAW)
+
+# Slot markers the template is split on at import, so the stylesheet needs no
+# brace escaping and nothing scans the template per render. NUL can't occur in
+# the CSS or markup, so a split can't land anywhere but the slot.
+_TITLE_SLOT = '\x00TITLE\x00'
+_CONTENT_SLOT = '\x00CONTENT\x00'
+
+HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>\x00TITLE\x00 - Training Guide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Sometype+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
+    <style>
+''' + _CSS_MIN + '''
     </style>
 </head>
 <body>
-{content}
+\x00CONTENT\x00
 </body>
 </html>
 '''
 
+# Split on the slots once; generate_to() writes the title and sections between the pieces
+_HEAD, _rest = HTML_TEMPLATE.split(_TITLE_SLOT, 1)
+_MID, _TAIL = _rest.split(_CONTENT_SLOT, 1)
+del _rest
+
 
 # =============================================================================
-# GUIDE GENERATOR CLASS
+# WORKOUT MODAL
 # =============================================================================
 
-class GuideGenerator:
-    def __init__(self, athlete_id: str):
-        self.athlete_id = athlete_id
-        self.profile = None
-        self.derived = None
-        self.weekly_structure = None
-        self.plan_config = None
-        self.plan_summary = None
-        
-        self._load_data()
-    
-    def _load_data(self):
-        """Load all athlete data files."""
-        base_path = Path(f"athletes/{self.athlete_id}")
-        
-        # Load profile
-        with open(base_path / "profile.yaml", 'r') as f:
-            self.profile = yaml.safe_load(f)
-        
-        # Load derived
-        with open(base_path / "derived.yaml", 'r') as f:
-            self.derived = yaml.safe_load(f)
-        
-        # Load weekly structure if exists
-        ws_path = base_path / "weekly_structure.yaml"
-        if ws_path.exists():
-            with open(ws_path, 'r') as f:
-                self.weekly_structure = yaml.safe_load(f)
-        
-        # Load plan config if exists
-        plans_dir = base_path / "plans"
-        if plans_dir.exists():
-            plan_dirs = [p for p in plans_dir.iterdir() if p.is_dir() and p.name != "current"]
-            if plan_dirs:
-                latest_plan = sorted(plan_dirs, key=lambda p: p.stat().st_mtime, reverse=True)[0]
-                
-                config_path = latest_plan / "plan_config.yaml"
-                if config_path.exists():
-                    with open(config_path, 'r') as f:
-                        self.plan_config = yaml.safe_load(f)
-                
-                summary_path = latest_plan / "plan_summary.json"
-                if summary_path.exists():
-                    with open(summary_path, 'r') as f:
-                        self.plan_summary = json.load(f)
-    
-    def _get_var(self, key: str, default: str = "") -> str:
-        """Get a variable from profile or derived data."""
-        # Check profile first
-        if '.' in key:
-            parts = key.split('.')
-            data = self.profile
-            for part in parts:
-                if data and isinstance(data, dict):
-                    data = data.get(part)
-                else:
-                    data = None
-            if data:
-                return str(data)
-        
-        # Direct lookups
-        if key in self.profile:
-            return str(self.profile[key])
-        if key in self.derived:
-            return str(self.derived[key])
-        
-        return default
+# Static workout detail copy shown by the ATP day modal, keyed by workout type
+_WORKOUT_DESCRIPTIONS = {
+    'strength': {
+        'title': 'Strength Session',
+        'duration': '45-60 min',
+        'description': 'Full-body strength workout targeting cycling-specific muscle groups.',
+        'instructions': [
+            'Watch video demos before new exercises',
+            'Complete warm-up activation circuit first',
+            'Rest 60-120s between sets (longer for heavy sets)',
+            'Stop if form breaks down',
+            'Log weights for progressive overload tracking'
+        ],
+        'file': 'Check your ZWO files for the specific workout'
+    },
+    'intervals': {
+        'title': 'Interval Session',
+        'duration': '60-90 min',
+        'description': 'Structured intensity work targeting specific energy systems.',
+        'instructions': [
+            '15-20 min warm-up before first interval',
+            "Hit target power, don't exceed it",
+            "If you can't complete reps, reduce target by 5%",
+            'Full recovery between sets',
+            'Easy spin cool-down'
+        ],
+        'zones': 'Varies by phase — check specific workout'
+    },
+    'easy_ride': {
+        'title': 'Easy / Recovery Ride',
+        'duration': '45-90 min',
+        'description': 'Truly easy spinning to promote recovery without adding fatigue.',
+        'instructions': [
+            'Zone 1-2 only — this should feel embarrassingly easy',
+            'Conversation pace throughout',
+            'No Strava segments, no chasing groups',
+            'Purpose is recovery, not fitness',
+            'If HR drifts into Z3, slow down'
+        ],
+        'zones': 'Z1-Z2 (<75% FTP)'
+    },
+    'long_ride': {
+        'title': 'Long Endurance Ride',
+        'duration': '2.5-5+ hours',
+        'description': 'Building aerobic base and time-in-saddle.',
+        'instructions': [
+            'Mostly Z2 with natural terrain variation',
+            'Practice race nutrition (target 60-80g carbs/hour)',
+            'Include some Z3 efforts if terrain demands',
+            'Build mental fortitude for long efforts',
+            'This is where endurance adaptations happen'
+        ],
+        'zones': 'Z2 primary (65-75% FTP), Z3 ok on climbs'
+    },
+    'tempo': {
+        'title': 'Tempo Ride',
+        'duration': '60-90 min',
+        'description': 'Sustained moderate effort building muscular endurance.',
+        'instructions': [
+            'Main set at 76-87% FTP (Z3)',
+            'Should feel comfortably hard',
+            'Can talk in short sentences',
+            "Don't let it creep into threshold",
+            'Good for building fatigue resistance'
+        ],
+        'zones': 'Z3 (76-87% FTP)'
+    },
+    'rest': {
+        'title': 'Rest Day',
+        'duration': '0 min',
+        'description': 'Complete rest — no training.',
+        'instructions': [
+            'No cycling (not even "easy")',
+            'Light walking/stretching is fine',
+            'Focus on sleep and nutrition',
+            'This is where adaptation happens',
+            "Don't feel guilty — rest IS training"
+        ]
+    }
+}
+
+_WORKOUT_DESCRIPTIONS_JSON = json.dumps(_WORKOUT_DESCRIPTIONS, ensure_ascii=False, separators=(',', ':'))
+
+_WORKOUT_MODAL_JS_HEAD = '''
+function showWorkoutModal(element) {
+    const week = element.dataset.week;
+    const day = element.dataset.day;
+    const phase = element.dataset.phase;
+    const am = element.dataset.am;
+    const pm = element.dataset.pm;
     
-    def _get_athlete_name(self) -> str:
-        return self.profile.get('name', self.athlete_id)
+    const modal = document.getElementById('workoutModal');
+    const title = document.getElementById('modalTitle');
+    const body = document.getElementById('modalBody');
     
-    def _get_first_name(self) -> str:
-        name = self._get_athlete_name()
-        return name.split()[0] if name else self.athlete_id
+    // Get workout info
+    const workoutType = (am || 'rest').toLowerCase().replace(/ /g, '_');
+    const workout = workoutDescriptions[workoutType] || workoutDescriptions['easy_ride'];
     
-    def _get_race_name(self) -> str:
-        return self.profile.get('target_race', {}).get('name', 'Gravel Race')
+    title.textContent = `Week ${week} · ${day.charAt(0).toUpperCase() + day.slice(1)} · ${workout.title}`;
     
-    def _get_race_date(self) -> str:
-        return self.profile.get('target_race', {}).get('date', 'TBD')
+    let html = `
+        <div class="workout-detail">
+            <div class="workout-detail-label">Phase</div>
+            <div>${phase}</div>
+        </div>
+        <div class="workout-detail">
+            <div class="workout-detail-label">Duration</div>
+            <div>${workout.duration}</div>
+        </div>
+        <div class="workout-detail">
+            <div class="workout-detail-label">Description</div>
+            <div>${workout.description}</div>
+        </div>
+    `;
     
-    def _get_tier(self) -> str:
-        return self.derived.get('tier', 'compete').upper()
+    if (workout.zones) {
+        html += `
+        <div class="workout-detail">
+            <div class="workout-detail-label">Target Zones</div>
+            <div>${workout.zones}</div>
+        </div>
+        `;
+    }
     
-    def _get_tier_hours(self) -> tuple:
-        tier = self.derived.get('tier', 'compete').lower()
-        hours = {
-            'ayahuasca': (4, 8),
-            'finisher': (8, 12),
-            'compete': (12, 18),
-            'podium': (18, 25)
-        }
-        return hours.get(tier, (10, 15))
+    html += `
+        <div class="workout-detail">
+            <div class="workout-detail-label">Execution Notes</div>
+            <ul style="margin: 8px 0 0 0; padding-left: 20px;">
+                ${workout.instructions.map(i => `<li>${i}</li>`).join('')}
+            </ul>
+        </div>
+    `;
     
-    def _calculate_age(self) -> Optional[int]:
-        birthday = self.profile.get('birthday')
-        if birthday:
+'''
+
+# Only emitted when the athlete's week has PM sessions to show
+_WORKOUT_MODAL_JS_PM = '''
+    if (pm) {
+        html += `
+        <div class="workout-detail" style="margin-top: 16px; padding-top: 12px; border-top: 1px dashed #ddd;">
+            <div class="workout-detail-label">PM Session</div>
+            <div>${pm.replace(/_/g, ' ').replace(/&/g, '&amp;').replace(/</g, '&lt;')}</div>
+        </div>
+        `;
+    }
+'''
+
+_WORKOUT_MODAL_JS_TAIL = '''
+    body.innerHTML = html;
+    modal.classList.add('open');
+}
+
+function closeWorkoutModal() {
+    document.getElementById('workoutModal').classList.remove('open');
+}
+
+// Close on Escape key
+document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') closeWorkoutModal();
+});
+'''
+
+_WORKOUT_MODAL_MARKUP = '''
+<!-- Workout Detail Modal -->
+<div class="workout-modal" id="workoutModal" onclick="if(event.target === this) closeWorkoutModal()">
+    <div class="workout-modal-content">
+        <div class="workout-modal-header">
+            <h3 id="modalTitle">Workout Details</h3>
+            <button class="workout-modal-close" onclick="closeWorkoutModal()">×</button>
+        </div>
+        <div id="modalBody">
+            <!-- Populated by JavaScript -->
+        </div>
+    </div>
+</div>
+
+'''
+
+
+def _build_workout_modal(pm_sessions: bool) -> str:
+    js = _WORKOUT_MODAL_JS_HEAD + (_WORKOUT_MODAL_JS_PM if pm_sessions else '') + _WORKOUT_MODAL_JS_TAIL
+    return (_WORKOUT_MODAL_MARKUP + '<script>\n'
+            + 'const workoutDescriptions = ' + _WORKOUT_DESCRIPTIONS_JSON + ';\n'
+            + _minify_js(js) + '\n</script>\n')
+
+
+_WORKOUT_MODAL_HTML = _build_workout_modal(pm_sessions=True)
+_WORKOUT_MODAL_HTML_AM_ONLY = _build_workout_modal(pm_sessions=False)
+
+
+# =============================================================================
+# MARKUP HELPERS
+# =============================================================================
+
+_TIMELINE_ITEM = '<div class="timeline-item"><div class="timeline-time">{time}</div><p>{body}</p></div>'
+_CALLOUT = '<div class="callout {kind}"><h4>{title}</h4>{body}</div>'
+
+
+def _timeline(items) -> str:
+    """Render (time, body) pairs as a timeline block."""
+    return '<div class="timeline">' + ''.join(
+        _TIMELINE_ITEM.format(time=time, body=body) for time, body in items
+    ) + '</div>'
+
+
+def _callout(kind: str, title: str, body: str) -> str:
+    return _CALLOUT.format(kind=kind, title=title, body=body)
+
+
+# Training fundamentals: the adaptation cycle
+_ADAPTATION_CYCLE = (
+    ('Step 1: Stress',
+     'You apply training stress—a workout that exceeds your current capacity. Muscle fibers develop microtears. Glycogen depletes. Your body registers this as a problem to solve.'),
+    ('Step 2: Fatigue',
+     "Immediately after, you're weaker than before. This is normal. Fatigue is the signal that triggers adaptation."),
+    ('Step 3: Recovery',
+     'Given adequate rest, nutrition, and time, your body repairs: muscle fibers rebuild, mitochondria multiply, capillary density increases.'),
+    ('Step 4: Supercompensation',
+     "Your body doesn't just return to baseline—it overshoots. You're now stronger than before."),
+    ('Step 5: Repeat',
+     'Apply slightly larger stress. The cycle repeats. Over weeks, these small adaptations compound into meaningful fitness gains.'),
+)
+
+# Race week protocol: race morning timeline
+_RACE_MORNING = (
+    ('3-4 Hours Before',
+     'Wake up. Eat familiar, high-carb, low-fiber breakfast. Target 1-2g carbs per kg.'),
+    ('2 Hours Before',
+     'Arrive at venue. Set up bike and gear. Use bathroom. Begin sipping fluids.'),
+    ('1 Hour Before',
+     'Final bike check: tire pressure, brakes, shifting. Short warm-up spin. Start pre-race nutrition (100-200 cal carbs).'),
+    ('30 Minutes Before',
+     'Run through highlight reel visualization. Review performance statements. Begin settling mind.'),
+    ('10 Minutes Before',
+     '6-2-7 breathing. Find your spot. Check nutrition is accessible.'),
+    ('Start',
+     'Controlled effort. Find sustainable rhythm. First gel at 20 minutes, not 60.'),
+)
+
+# Nutrition section: static fueling tips
+_DURING_TRAINING_CALLOUT = _callout('tip', 'During Training — The 60-80g Per Hour Rule', '''
+<p>For any ride <strong>over 90 minutes at moderate-to-high intensity (Z3+)</strong>, you need <strong>60-80g of carbohydrates per hour.</strong></p>
+<p style="font-size: 12px; color: #666;">Your gut can absorb ~60g glucose/hour. Add fructose (different transporters) to reach 90g. Sweet spot: 70-75g/hour.</p>
+
+<table style="margin: 12px 0;">
+    <thead>
+        <tr>
+            <th>Session Type</th>
+            <th>Duration</th>
+            <th>Carbs/Hour</th>
+            <th>When to Start</th>
+            <th>What to Use</th>
+        </tr>
+    </thead>
+    <tbody>
+        <tr>
+            <td>Z2 Endurance</td>
+            <td>2-4 hours</td>
+            <td>40-60g</td>
+            <td>After 60 min</td>
+            <td>Real food: PB&J, bananas, bars</td>
+        </tr>
+        <tr>
+            <td>Tempo/G-Spot</td>
+            <td>2-3 hours</td>
+            <td>60-80g</td>
+            <td>Start at 30-45 min</td>
+            <td>Mix: liquids + solids</td>
+        </tr>
+        <tr>
+            <td>Threshold/VO2max</td>
+            <td>60-90 min</td>
+            <td>Pre-workout sufficient<br>+ 1 gel mid-session</td>
+            <td>Between efforts</td>
+            <td>Gel or sports drink</td>
+        </tr>
+        <tr>
+            <td>Race/Long hard</td>
+            <td>&gt;90 min</td>
+            <td>60-90g</td>
+            <td>Start at 30 min</td>
+            <td>Mix: drinks + gels/chews<br>(2:1 glucose:fructose if &gt;60g)</td>
+        </tr>
+    </tbody>
+</table>
+<p style="font-size: 11px; margin-top: 8px; color: #666;"><strong>Critical:</strong> Start fueling at 30 minutes, not 60. By the time you feel hungry, you're already behind. Set a timer.</p>
+''')
+
+_TIMING_MISTAKES_CALLOUT = _callout('tip', 'Common Timing Mistakes', '''
+<ul style="margin: 8px 0;">
+    <li><strong>Waiting until hungry to fuel</strong> — By then it's too late. Set a timer.</li>
+    <li><strong>Skipping pre-workout meal</strong> — You'll bonk mid-session. Eat 2-3 hours before.</li>
+    <li><strong>Not eating post-workout</strong> — Recovery window closes fast. Eat within 60 minutes.</li>
+    <li><strong>Trying new foods on race day</strong> — Test everything in training first.</li>
+    <li><strong>Overthinking it</strong> — Simple carbs before/during, protein+carbs after. That's 90% of it.</li>
+</ul>
+''')
+
+_FUEL_THE_WORK_CALLOUT = _callout('tip', 'Fuel the Work', '''
+<p><strong>Common mistake:</strong> Eating less to lose weight during hard training blocks.</p>
+<p><strong>Reality:</strong> Underfueling impairs adaptation, increases injury risk, and tanks performance. Eat for the work you're doing. Weight management happens in easy phases, not build phases.</p>
+''')
+
+
+# =============================================================================
+# STATIC SECTIONS
+# =============================================================================
+
+# Sections with no athlete-specific content, built once at import
+
+_FUNDAMENTALS_HTML = f'''
+<section id="training-fundamentals">
+    <h2>4 · Training Fundamentals</h2>
+    
+    <p>Before executing workouts, understand how training works at a mechanical level.</p>
+    
+    <h3>The Adaptation Cycle</h3>
+    
+    {_timeline(_ADAPTATION_CYCLE)}
+    
+    <h3>The Practical Rules</h3>
+    <ol>
+        <li><strong>Training stress must be adequate but not excessive</strong> — Hard enough to trigger adaptation. Not so hard you can't recover.</li>
+        <li><strong>Recovery is training</strong> — Sleep, nutrition, stress management. This is where adaptation happens.</li>
+        <li><strong>Consistency compounds</strong> — Ten weeks of steady training beats four weeks of heroics followed by burnout.</li>
+        <li><strong>Patience is required</strong> — Meaningful adaptation takes weeks and months, not days.</li>
+    </ol>
+</section>
+'''
+
+_ZONES_HTML = '''
+<section id="training-zones">
+    <h2>5 · Training Zones</h2>
+    
+    <p>Zones quantify intensity. But the end goal of measuring intensity is to help you <strong>develop a feeling for intensity</strong>.</p>
+    
+    <table>
+        <thead>
+            <tr>
+                <th>Zone</th>
+                <th>Name</th>
+                <th>% FTP</th>
+                <th>Feel</th>
+            </tr>
+        </thead>
+        <tbody>
+            <tr>
+                <td><strong>Z1</strong></td>
+                <td>Active Recovery</td>
+                <td>&lt;55%</td>
+                <td>Very easy. Full conversation possible. Doesn't feel like training.</td>
+            </tr>
+            <tr>
+                <td><strong>Z2</strong></td>
+                <td>Endurance</td>
+                <td>56-75%</td>
+                <td>All-day pace. Can chat freely. <strong>Most of your training lives here.</strong></td>
+            </tr>
+            <tr>
+                <td><strong>Z3</strong></td>
+                <td>Tempo</td>
+                <td>76-87%</td>
+                <td>Comfortably hard. Talking in short sentences.</td>
+            </tr>
+            <tr class="zone-row-gspot">
+                <td><strong>G-Spot</strong></td>
+                <td>Gravel Race Pace</td>
+                <td>88-92%</td>
+                <td>Uncomfortably sustainable. Hard enough to hurt, easy enough to repeat.</td>
+            </tr>
+            <tr>
+                <td><strong>Z4</strong></td>
+                <td>Threshold</td>
+                <td>93-105%</td>
+                <td>Hard, controlled. Can only say a few words.</td>
+            </tr>
+            <tr>
+                <td><strong>Z5</strong></td>
+                <td>VO2max</td>
+                <td>106-120%</td>
+                <td>Very hard. Near maximum. Speech impossible.</td>
+            </tr>
+            <tr>
+                <td><strong>Z6</strong></td>
+                <td>Anaerobic</td>
+                <td>121-150%</td>
+                <td>All-out. 30 seconds to 3 minutes max.</td>
+            </tr>
+        </tbody>
+    </table>
+    
+    <div class="callout alert">
+        <h4>The Most Common Mistake</h4>
+        <p><strong>Easy means easy.</strong> Most people train too hard on easy days. Z2 should feel genuinely conversational. If you're breathing hard, you're in Z3.</p>
+        <p>Fix this. It's the most common training mistake.</p>
+    </div>
+    
+    <h3>When Devices and Body Conflict</h3>
+    <p>Power meters can lie (bad calibration, stale FTP). Heart rate can be misleading (heat, dehydration, caffeine, illness).</p>
+    <p><strong>Your body doesn't lie.</strong> If 90% FTP feels like 9/10 today when it should feel like 7/10, something's wrong. Trust your body.</p>
+</section>
+'''
+
+_EXECUTION_HTML = '''
+<section id="workout-execution">
+    <h2>6 · Workout Execution</h2>
+    
+    <p>There's a massive gap between what's written on the plan and what actually happens. This section teaches you how to close that gap.</p>
+    
+    <h3>Universal Rules</h3>
+    
+    <h4>1. Warm Up Properly</h4>
+    <p>For intensity sessions: 15-20 minutes Z1→Z2→Z3. Include 3×1 min at Z3-Z4 to "open the legs." 2-3 minutes easy spin before first work interval.</p>
+    
+    <h4>2. Do the Actual Workout</h4>
+    <p>Execute what's prescribed. Not more. Not less. Adding volume or intensity might feel productive, but it accumulates fatigue and ruins tomorrow's workout.</p>
+    
+    <h4>3. Chase Time-in-Zone, Not Hero Intervals</h4>
+    <p>The goal is highest average power across the entire set, not crushing the first interval then dying.</p>
+    
+    <table>
+        <thead>
+            <tr>
+                <th>Bad Execution</th>
+                <th>Good Execution</th>
+            </tr>
+        </thead>
+        <tbody>
+            <tr>
+                <td>
+                    Interval 1: 320W (way too hard)<br>
+                    Interval 2: 290W (struggling)<br>
+                    Interval 3: 270W (barely hanging on)<br>
+                    Interval 4: Failed<br>
+                    <strong>Total: 3 intervals, 293W avg</strong>
+                </td>
+                <td>
+                    Interval 1: 300W (controlled)<br>
+                    Interval 2: 300W (harder but doable)<br>
+                    Interval 3: 295W (hardest one)<br>
+                    Interval 4: 295W (finished strong)<br>
+                    <strong>Total: 4 intervals, 297.5W avg</strong>
+                </td>
+            </tr>
+        </tbody>
+    </table>
+    
+    <h4>4. Stop If Power Drops >10%</h4>
+    <p>Quality beats quantity. Four quality intervals at 300W beats six degraded intervals averaging 270W.</p>
+    
+    <h3>Indoor vs Outdoor</h3>
+    <p><strong>Ride indoors:</strong> Interval sessions, short workouts (&lt;90 min), bad weather, time-crunched days.</p>
+    <p><strong>Ride outdoors:</strong> Long endurance rides (2+ hours), skills practice, mental freshness, race-specific terrain.</p>
+</section>
+'''
+
+_FUELING_HTML = '''
+<section id="fueling">
+    <h2>8 · Fueling & Hydration</h2>
+    
+    <p>You can have perfect training, a dialed bike, and excellent pacing strategy. None of it matters if you run out of fuel halfway through.</p>
+    
+    <h3>Quick Reference</h3>
+    <table>
+        <thead>
+            <tr>
+                <th>Scenario</th>
+                <th>Carbs</th>
+                <th>Fluid</th>
+            </tr>
+        </thead>
+        <tbody>
+            <tr><td>Training &lt;2 hours</td><td>30-45g/hour</td><td>500-750ml/hour</td></tr>
+            <tr><td>Training 2-4 hours</td><td>45-60g/hour</td><td>500-750ml/hour</td></tr>
+            <tr><td>Long ride 4-6 hours</td><td>60-75g/hour</td><td>500-750ml/hour</td></tr>
+            <tr><td>Race day</td><td>60-90g/hour</td><td>500-750ml/hour</td></tr>
+            <tr><td>Hot conditions (&gt;80°F)</td><td>60-90g/hour</td><td>750-1000ml/hour</td></tr>
+        </tbody>
+    </table>
+    
+    <h3>Daily Nutrition</h3>
+    <ul>
+        <li><strong>Protein:</strong> 1.6-2.2g per kg bodyweight</li>
+        <li><strong>Carbs:</strong> 3-7g per kg (depends on training volume)</li>
+        <li><strong>Fat:</strong> 0.8-1.2g per kg bodyweight</li>
+    </ul>
+    
+    <h3>Race Day Fueling</h3>
+    <p><strong>Pre-race (3-4 hours before):</strong> 2-3g carbs per kg. Familiar foods only.</p>
+    <p><strong>During race:</strong> Start fueling at 30 minutes. 70-80g carbs per hour. <strong>Set a timer.</strong></p>
+    
+    <div class="callout alert">
+        <h4>When Your Stomach Rebels</h4>
+        <ol>
+            <li>Back off intensity for 5-10 minutes</li>
+            <li>Switch to liquid calories temporarily</li>
+            <li>Small sips, not big gulps</li>
+            <li>Don't panic and stop eating entirely—you'll bonk</li>
+        </ol>
+    </div>
+    
+    <h3>Train Your Gut</h3>
+    <p>Your gut is trainable. If you never eat during training rides, your gut won't tolerate eating during races. Practice fueling on every long ride.</p>
+</section>
+'''
+
+_MENTAL_HTML = '''
+<section id="mental-training">
+    <h2>9 · Mental Training</h2>
+    
+    <p>Physical training builds the engine. Mental training determines whether you use that engine when things get hard.</p>
+    
+    <h3>6-2-7 Breathing Technique</h3>
+    <p><strong>The pattern:</strong> Inhale 6 seconds, hold 2 seconds, exhale 7 seconds.</p>
+    <p>The key is the exhale is longer than inhale—this triggers the calming response.</p>
+    <p><strong>Use it for:</strong> Pre-race anxiety, mid-race panic, after a bad section.</p>
+    
+    <h3>Performance Statements</h3>
+    <p>Pre-planned phrases that replace negative self-talk:</p>
+    
+    <table>
+        <thead>
+            <tr>
+                <th>Type</th>
+                <th>Examples</th>
+            </tr>
+        </thead>
+        <tbody>
+            <tr>
+                <td><strong>Technical cues</strong></td>
+                <td>"Smooth pedal stroke" • "Relax your shoulders" • "Light hands"</td>
+            </tr>
+            <tr>
+                <td><strong>Pain responses</strong></td>
+                <td>"This is supposed to be hard" • "Pain is temporary, quitting is permanent"</td>
+            </tr>
+            <tr>
+                <td><strong>Process statements</strong></td>
+                <td>"Just get to the next aid station" • "One more climb" • "Next mile marker"</td>
+            </tr>
+        </tbody>
+    </table>
+    
+    <h3>Personal Highlight Reel</h3>
+    <p>Build a mental movie you can play to access confidence:</p>
+    <ol>
+        <li><strong>Scene 1:</strong> A past moment when you overcame something difficult</li>
+        <li><strong>Scene 2:</strong> A future crucial moment in this race—see yourself executing perfectly</li>
+        <li><strong>Scene 3:</strong> Crossing the finish line—in full sensory detail</li>
+    </ol>
+    <p>Practice until you can trigger the confident feeling on demand.</p>
+</section>
+'''
+
+
+# =============================================================================
+# FILE HELPERS
+# =============================================================================
+
+# Parsed data files by path, stamped with (st_mtime_ns, st_size). A second
+# GuideGenerator for the same athlete costs a few stat() calls.
+_PARSE_CACHE: Dict[str, tuple] = {}
+
+
+def _parse_yaml(data: bytes) -> Any:
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def _load_cached(path: str, parser: Callable[[bytes], Any]) -> Any:
+    """Parse a data file, reusing the previous result if it hasn't changed on disk.
+
+    The parsed object is shared between generators, so treat it as read-only.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _PARSE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, 'rb') as f:
+        data = parser(f.read())
+    _PARSE_CACHE[path] = (stamp, data)
+    return data
+
+
+# =============================================================================
+# GUIDE GENERATOR CLASS
+# =============================================================================
+
+# Table of contents: the entries every guide gets, rendered once and split
+# around the race name, plus the optional tail entries
+_TOC_ITEM = '<li><a href="#{}">{}</a></li>'
+_RACE_SLOT = '\x00RACE\x00'
+_TOC_FIXED = (
+    ("quick-reference", "Quick Reference"),
+    ("race-timeline", "Your Race Calendar"),
+    ("your-goals", "Your Goals"),
+    ("training-philosophy", "Your Training Philosophy"),
+    ("blindspots", "Your Blindspots"),
+    ("atp", "24-Week Training Plan"),
+    ("your-schedule", "Your Weekly Schedule"),
+    ("phase-progression", "Phase Progression"),
+    ("training-fundamentals", "Training Fundamentals"),
+    ("training-zones", "Training Zones"),
+    ("workout-execution", "Workout Execution"),
+    ("strength-program", "Your Strength Program"),
+    ("nutrition", "Nutrition & Fueling"),
+    ("mental-training", "Mental Training"),
+    ("race-tactics", f"Race Tactics for {_RACE_SLOT}"),
+    ("race-week", "Race Week Protocol"),
+)
+
+
+def _split_toc(entries) -> tuple:
+    return tuple("\n".join(_TOC_ITEM.format(anchor, title) for anchor, title in entries).split(_RACE_SLOT))
+
+
+# Keyed by whether the guide has a weekly schedule section to link to
+_TOC_FIXED_SPLIT = {
+    True: _split_toc(_TOC_FIXED),
+    False: _split_toc(e for e in _TOC_FIXED if e[0] != "your-schedule"),
+}
+_TOC_MASTERS = _TOC_ITEM.format("masters", "Masters-Specific Considerations")
+_TOC_WOMEN = _TOC_ITEM.format("women", "Women-Specific Considerations")
+_TOC_FAQ = _TOC_ITEM.format("faq", "FAQ")
+
+# Read the clock once per process; a batch run stamps every guide the same day
+_NOW = datetime.now()
+_TODAY_STR = _NOW.strftime('%B %d, %Y')
+
+# Weekly hours (min, max) per training tier
+_TIER_HOURS = {
+    'ayahuasca': (4, 8),
+    'finisher': (8, 12),
+    'compete': (12, 18),
+    'podium': (18, 25)
+}
+
+# Dotted _get_var keys, split once
+_KEY_PATHS: Dict[str, tuple] = {}
+
+# Interned so dict lookups on these hit CPython's identity fast path
+_WEEKDAYS = tuple(sys.intern(d) for d in (
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'
+))
+
+_CYCLING_PHASE_DESC = {sys.intern(phase): desc for phase, desc in (
+    ("Base", "Building aerobic foundation. Long Z2 rides. Establishing rhythm."),
+    ("Build", "Adding intensity. Race-specific fitness. G-Spot work."),
+    ("Peak", "Maximum training load. Race simulation. Proving readiness."),
+    ("Taper", "Reducing volume, maintaining intensity. Arriving fresh."),
+)}
+
+# (cycling phase, weeks, strength phase) for 20+ and 12-19 week plans; shorter
+# plans depend on the exact length and are built in _generate_phase_progression
+_PHASES_GE20 = (
+    ("Base", "1-4", "Learn to Lift"),
+    ("Build", "5-12", "Lift Heavy Sh*t"),
+    ("Peak", "13-18", "Lift Fast"),
+    ("Taper", "19-20", "Don't Lose It"),
+)
+_PHASES_GE12 = (
+    ("Base", "1-3", "Learn to Lift"),
+    ("Build", "4-7", "Lift Heavy Sh*t"),
+    ("Peak", "8-10", "Lift Fast"),
+    ("Taper", "11-12", "Don't Lose It"),
+)
+
+_PHASE_CARD_TMPL = '''
+<div class="phase-card">
+    <div class="phase-card-header">{cycling_phase} Phase — Weeks {weeks}</div>
+    <div class="phase-card-body">
+        <p><strong>Cycling:</strong> {desc}</p>
+        <p><strong>Strength:</strong> {strength_phase}</p>
+    </div>
+</div>
+'''
+
+# One row of the weekly schedule table
+_ROW_FMT = '<tr><td><strong>{day}</strong>{badge}</td><td>{am}</td><td>{pm}</td><td>{notes}</td></tr>'
+_KEY_BADGE = '<span class="key-day">KEY</span>'
+
+# Sections every guide gets, in document order (see GuideGenerator._section_names)
+_CORE_SECTIONS = (
+    'header',
+    'toc',
+    'quick_reference',
+    'race_timeline',
+    'your_goals',
+    'training_philosophy',
+    'blindspots',
+    'atp_table',
+    'your_weekly_schedule',
+    'phase_progression',
+    'training_fundamentals',
+    'training_zones',
+    'workout_execution',
+    'strength_program',
+    'nutrition_section',
+    'mental_training',
+    'race_tactics',
+    'race_week',
+)
+
+
+class GuideGenerator:
+    def __init__(self, athlete_id: str):
+        self.athlete_id = athlete_id
+        self.profile = None
+        self.derived = None
+        self.weekly_structure = None
+        self.plan_config = None
+        self.plan_summary = None
+        
+        self._load_data()
+        
+        # Partial evaluation: skip content that can't apply to this athlete
+        self.needs_recovery_nutrition = self._has_multiple_hard_sessions()
+        self.has_pm_sessions = self._has_pm_sessions()
+    
+    def _load_data(self):
+        """Load all athlete data files."""
+        # Plain string paths: this runs per guide and pathlib's / allocates
+        base_path = f"athletes/{self.athlete_id}"
+        
+        # Load profile
+        self.profile = _load_cached(os.path.join(base_path, "profile.yaml"), _parse_yaml)
+        
+        # Load derived
+        self.derived = _load_cached(os.path.join(base_path, "derived.yaml"), _parse_yaml)
+        
+        # Load weekly structure if exists
+        ws_path = os.path.join(base_path, "weekly_structure.yaml")
+        if os.path.isfile(ws_path):
+            self.weekly_structure = _load_cached(ws_path, _parse_yaml)
+        
+        # Load plan config if exists
+        plans_dir = os.path.join(base_path, "plans")
+        if os.path.isdir(plans_dir):
+            # DirEntry caches its stat(), so this is one syscall per plan dir
+            with os.scandir(plans_dir) as entries:
+                plan_dirs = [e for e in entries if e.is_dir() and e.name != "current"]
+            if plan_dirs:
+                latest_plan = max(plan_dirs, key=lambda e: e.stat().st_mtime).path
+                
+                config_path = os.path.join(latest_plan, "plan_config.yaml")
+                if os.path.isfile(config_path):
+                    self.plan_config = _load_cached(config_path, _parse_yaml)
+                
+                summary_path = os.path.join(latest_plan, "plan_summary.json")
+                if os.path.isfile(summary_path):
+                    self.plan_summary = _load_cached(summary_path, _parse_json)
+        
+        # Values read by many sections, resolved once per guide
+        target_race = self._target_race = self.profile.get('target_race') or {}
+        name = self.profile.get('name', self.athlete_id)
+        tier = self.derived.get('tier', 'compete')
+        self._athlete_name = name
+        self._first_name = name.split()[0] if name else self.athlete_id
+        self._race_name = target_race.get('name', 'Gravel Race')
+        self._race_date = target_race.get('date', 'TBD')
+        self._tier = tier.upper()
+        self._tier_hours = _TIER_HOURS.get(tier.lower(), (10, 15))
+        self._plan_weeks = self.derived.get('plan_weeks', 12)
+        self._strength_freq = self.derived.get('strength_frequency', 2)
+        self._age = self._calculate_age()
+        self._is_masters_ = self._age is not None and self._age >= 50
+        self._is_female_ = self.profile.get('sex', '').lower() == 'female'
+        
+        # Free-text fields escaped once for interpolation into markup
+        self._first_name_html = escape(str(self._first_name))
+        self._race_name_html = escape(str(self._race_name))
+        self._race_date_html = escape(str(self._race_date))
+    
+    def _get_var(self, key: str, default: str = "") -> str:
+        """Get a variable from profile or derived data."""
+        # Check profile first
+        if '.' in key:
+            path = _KEY_PATHS.get(key) or _KEY_PATHS.setdefault(key, tuple(key.split('.')))
+            data = self.profile
             try:
-                birth = datetime.strptime(birthday, "%Y-%m-%d")
-                today = datetime.now()
-                return today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
-            except:
-                pass
+                for part in path:
+                    data = data.get(part)
+                    if data is None:
+                        break
+            except AttributeError:  # Path runs through a scalar
+                data = None
+            if data:
+                return str(data)
+        
+        # Direct lookups
+        if key in self.profile:
+            return str(self.profile[key])
+        if key in self.derived:
+            return str(self.derived[key])
+        
+        return default
+    
+    def _get_athlete_name(self) -> str:
+        return self._athlete_name
+    
+    def _get_first_name(self) -> str:
+        return self._first_name
+    
+    def _get_race_name(self) -> str:
+        return self._race_name
+    
+    def _get_race_date(self) -> str:
+        return self._race_date
+    
+    def _get_tier(self) -> str:
+        return self._tier
+    
+    def _get_tier_hours(self) -> tuple:
+        return self._tier_hours
+    
+    def _calculate_age(self) -> Optional[int]:
+        """Age from the profile birthday. Called once by _load_data; use self._age."""
+        birthday = self.profile.get('birthday')
+        if birthday:
+            # Fixed YYYY-MM-DD, so slice instead of going through strptime;
+            # date() still rejects days that don't exist, like Feb 30
+            try:
+                if (len(birthday) != 10 or birthday[4] != '-' or birthday[7] != '-'
+                        or not (birthday[0:4] + birthday[5:7] + birthday[8:10]).isdigit()):
+                    return None
+                birth = date(int(birthday[0:4]), int(birthday[5:7]), int(birthday[8:10]))
+            except (TypeError, ValueError):  # Not a string, or not a real date
+                return None
+            today = _NOW
+            return today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
         return None
     
     def _is_masters(self) -> bool:
-        age = self._calculate_age()
-        return age is not None and age >= 50
+        return self._is_masters_
     
     def _is_female(self) -> bool:
-        return self.profile.get('sex', '').lower() == 'female'
+        return self._is_female_
     
-    def generate(self) -> str:
-        """Generate the complete HTML guide."""
-        sections = []
-        
-        # Header
-        sections.append(self._generate_header())
-        
-        # Table of Contents
-        sections.append(self._generate_toc())
-        
-        # Sections
-        sections.append(self._generate_quick_reference())
-        sections.append(self._generate_race_timeline())
-        sections.append(self._generate_your_goals())
-        sections.append(self._generate_training_philosophy())
-        sections.append(self._generate_blindspots())
-        sections.append(self._generate_atp_table())
-        sections.append(self._generate_your_weekly_schedule())
-        sections.append(self._generate_phase_progression())
-        sections.append(self._generate_training_fundamentals())
-        sections.append(self._generate_training_zones())
-        sections.append(self._generate_workout_execution())
-        sections.append(self._generate_strength_program())
-        sections.append(self._generate_nutrition_section())
-        sections.append(self._generate_mental_training())
-        sections.append(self._generate_race_tactics())
-        sections.append(self._generate_race_week())
+    def _has_multiple_hard_sessions(self) -> bool:
+        """True if the week has two or more hard (key) sessions."""
+        if not self.weekly_structure:
+            return True  # Unknown schedule, keep the guidance
+        days = self.weekly_structure.get('days', {})
+        # Any two key days can land within 24-36h of each other (e.g. Thu PM
+        # then Sat AM), so the count is what matters, not adjacency
+        return sum(1 for d in _WEEKDAYS if (days.get(d) or {}).get('is_key_day')) >= 2
+    
+    def _has_pm_sessions(self) -> bool:
+        if not self.weekly_structure:
+            return False  # Generic ATP days are AM only
+        days = self.weekly_structure.get('days', {})
+        return any(schedule.get('pm') for schedule in days.values() if schedule)
+    
+    def _section_names(self) -> List[str]:
+        """Section generators to run, in document order."""
+        names = list(_CORE_SECTIONS)
         
         # Conditional sections
         if self._is_masters():
-            sections.append(self._generate_masters_section())
-        
+            names.append('masters_section')
         if self._is_female():
-            sections.append(self._generate_women_section())
-        
-        sections.append(self._generate_faq())
-        sections.append(self._generate_footer())
+            names.append('women_section')
         
-        content = "\n\n".join(sections)
-        
-        return HTML_TEMPLATE.format(
-            title=f"{self._get_race_name()} - {self._get_first_name()}",
-            content=content
-        )
+        names.append('faq')
+        names.append('footer')
+        return names
+    
+    def generate(self) -> str:
+        """Generate the complete HTML guide."""
+        buf = io.StringIO()
+        self.generate_to(buf)
+        return buf.getvalue()
+    
+    def generate_to(self, fp: TextIO) -> None:
+        """Write the complete HTML guide to fp one section at a time."""
+        self._write_sections(fp.write)
+    
+    def generate_to_binary(self, fp: BinaryIO) -> None:
+        """Write the guide to a binary file as pre-encoded UTF-8 chunks."""
+        # Encoding each chunk ourselves skips the TextIOWrapper encoder and
+        # its per-write newline translation
+        self._write_sections(lambda chunk: fp.write(chunk.encode('utf-8')))
+    
+    def _write_sections(self, write: Callable[[str], Any]) -> None:
+        # Sections are independent, but run sequentially: all file I/O has
+        # already happened in _load_data and the rest is GIL-bound string
+        # formatting, so a thread pool only adds dispatch overhead.
+        write(_HEAD)
+        write(f"{self._race_name_html} - {self._first_name_html}")
+        write(_MID)
+        sep = ""
+        for name in self._section_names():
+            # Sections without data to show return "" and are left out
+            if section := getattr(self, f'_generate_{name}')():
+                write(sep)
+                write(section)
+                sep = "\n\n"
+        write(_TAIL)
     
     # =========================================================================
     # SECTION GENERATORS
@@ -1293,53 +2095,34 @@ class GuideGenerator:
     
     def _generate_header(self) -> str:
         hours_min, hours_max = self._get_tier_hours()
-        plan_weeks = self.derived.get('plan_weeks', 12)
-        strength_freq = self.derived.get('strength_frequency', 2)
+        plan_weeks = self._plan_weeks
+        strength_freq = self._strength_freq
         
         return f'''
 <header class="guide-header">
-    <h1>{self._get_race_name()}</h1>
-    <p class="guide-subtitle">{self._get_tier()} · {plan_weeks}-Week Training Plan · {self._get_first_name()}</p>
+    <h1>{self._race_name_html}</h1>
+    <p class="guide-subtitle">{self._get_tier()} · {plan_weeks}-Week Training Plan · {self._first_name_html}</p>
     <div class="guide-meta">
         <span>{hours_min}-{hours_max} hours/week</span>
         <span>{plan_weeks} weeks</span>
         <span>Strength {strength_freq}x/week</span>
-        <span>Race: {self._get_race_date()}</span>
+        <span>Race: {self._race_date_html}</span>
     </div>
 </header>
 '''
     
     def _generate_toc(self) -> str:
-        toc_items = [
-            ("quick-reference", "Quick Reference"),
-            ("race-timeline", "Your Race Calendar"),
-            ("your-goals", "Your Goals"),
-            ("training-philosophy", "Your Training Philosophy"),
-            ("blindspots", "Your Blindspots"),
-            ("atp", "24-Week Training Plan"),
-            ("your-schedule", "Your Weekly Schedule"),
-            ("phase-progression", "Phase Progression"),
-            ("training-fundamentals", "Training Fundamentals"),
-            ("training-zones", "Training Zones"),
-            ("workout-execution", "Workout Execution"),
-            ("strength-program", "Your Strength Program"),
-            ("nutrition", "Nutrition & Fueling"),
-            ("mental-training", "Mental Training"),
-            ("race-tactics", f"Race Tactics for {self._get_race_name()}"),
-            ("race-week", "Race Week Protocol"),
-        ]
+        head, tail = _TOC_FIXED_SPLIT[bool(self.weekly_structure)]
+        toc_items = [head + self._race_name_html + tail]
         
         if self._is_masters():
-            toc_items.append(("masters", "Masters-Specific Considerations"))
+            toc_items.append(_TOC_MASTERS)
         if self._is_female():
-            toc_items.append(("women", "Women-Specific Considerations"))
+            toc_items.append(_TOC_WOMEN)
         
-        toc_items.append(("faq", "FAQ"))
+        toc_items.append(_TOC_FAQ)
         
-        items_html = "\n".join([
-            f'<li><a href="#{id}">{title}</a></li>'
-            for id, title in toc_items
-        ])
+        items_html = "\n".join(toc_items)
         
         return f'''
 <nav class="toc">
@@ -1352,10 +2135,10 @@ class GuideGenerator:
     
     def _generate_quick_reference(self) -> str:
         hours_min, hours_max = self._get_tier_hours()
-        plan_weeks = self.derived.get('plan_weeks', 12)
-        strength_freq = self.derived.get('strength_frequency', 2)
+        plan_weeks = self._plan_weeks
+        strength_freq = self._strength_freq
         
-        target_race = self.profile.get('target_race', {})
+        target_race = self._target_race
         
         return f'''
 <section id="quick-reference">
@@ -1363,15 +2146,15 @@ class GuideGenerator:
     
     <div class="quick-stats">
         <div class="stat-box">
-            <span class="stat-value">{self._get_race_name()}</span>
+            <span class="stat-value">{self._race_name_html}</span>
             <span class="stat-label">Target Race</span>
         </div>
         <div class="stat-box">
-            <span class="stat-value">{self._get_race_date()}</span>
+            <span class="stat-value">{self._race_date_html}</span>
             <span class="stat-label">Race Date</span>
         </div>
         <div class="stat-box">
-            <span class="stat-value">{target_race.get('goal_type', 'Compete').title()}</span>
+            <span class="stat-value">{escape(target_race.get('goal_type', 'Compete').title())}</span>
             <span class="stat-label">Goal</span>
         </div>
         <div class="stat-box">
@@ -1402,7 +2185,7 @@ class GuideGenerator:
     
     def _generate_race_timeline(self) -> str:
         """Generate accordion-style race calendar showing A/B/C events."""
-        target_race = self.profile.get('target_race', {})
+        target_race = self._target_race
         a_events = self.profile.get('a_events', [])
         b_events = self.profile.get('b_events', [])
         c_events = self.profile.get('c_events', [])
@@ -1438,7 +2221,7 @@ class GuideGenerator:
         all_events.sort(key=parse_date)
         
         # Calculate weeks until race
-        today = datetime.now()
+        today = _NOW
         
         # Build accordion items
         accordion_items = []
@@ -1457,6 +2240,11 @@ class GuideGenerator:
                 'pr': 'Personal record'
             }.get(e.get('goal', ''), e.get('goal', 'TBD'))
             
+            # Event fields are free text from the profile
+            name_html = escape(str(e.get('name', 'Race')))
+            distance_html = escape(f"{e.get('distance', 'TBD')} {e.get('distance_unit', '')}")
+            notes_html = escape(str(e['notes'])) if e.get('notes') else ''
+            
             open_class = 'open' if i == 0 else ''  # First one open by default
             
             accordion_items.append(f'''
@@ -1465,7 +2253,7 @@ class GuideGenerator:
                     <div class="race-accordion-title">
                         <div class="race-priority {e['priority_class']}">{e['priority']}</div>
                         <div>
-                            <div class="race-name">{e.get('name', 'Race')}</div>
+                            <div class="race-name">{name_html}</div>
                             <div class="race-date">{date_str} · {weeks_out} weeks out</div>
                         </div>
                     </div>
@@ -1475,11 +2263,11 @@ class GuideGenerator:
                     <div class="race-details-grid">
                         <div class="race-detail">
                             <div class="race-detail-label">Distance</div>
-                            <div class="race-detail-value">{e.get('distance', 'TBD')} {e.get('distance_unit', '')}</div>
+                            <div class="race-detail-value">{distance_html}</div>
                         </div>
                         <div class="race-detail">
                             <div class="race-detail-label">Goal</div>
-                            <div class="race-detail-value">{goal_desc}</div>
+                            <div class="race-detail-value">{escape(str(goal_desc))}</div>
                         </div>
                         <div class="race-detail">
                             <div class="race-detail-label">Priority</div>
@@ -1490,7 +2278,7 @@ class GuideGenerator:
                             <div class="race-detail-value">{'Full 2-week taper' if e['priority'] == 'A' else '1-week mini-taper' if e['priority'] == 'B' else 'None — train through'}</div>
                         </div>
                     </div>
-                    {f'<p style="margin-top: 12px; font-size: 13px; color: #666;"><strong>Notes:</strong> {e.get("notes", "")}</p>' if e.get('notes') else ''}
+                    {f'<p style="margin-top: 12px; font-size: 13px; color: #666;"><strong>Notes:</strong> {notes_html}</p>' if notes_html else ''}
                 </div>
             </div>
             ''')
@@ -1518,7 +2306,7 @@ class GuideGenerator:
     
     def _generate_your_goals(self) -> str:
         """Generate section showing athlete's stated goals."""
-        target_race = self.profile.get('target_race', {})
+        target_race = self._target_race
         primary_goal = self.profile.get('primary_goal', 'specific_race')
         goal_type = target_race.get('goal_type', 'compete')
         
@@ -1792,7 +2580,7 @@ class GuideGenerator:
             })
         
         # 7. Age considerations
-        age = self._calculate_age()
+        age = self._age
         if age and age >= 45:
             blindspots.append({
                 'severity': 'medium',
@@ -1926,7 +2714,7 @@ class GuideGenerator:
     
     def _generate_atp_table(self) -> str:
         """Generate interactive Annual Training Plan table."""
-        plan_weeks = self.derived.get('plan_weeks', 12)
+        plan_weeks = self._plan_weeks
         
         # Determine phases based on plan length
         if plan_weeks >= 20:
@@ -2070,14 +2858,17 @@ document.addEventListener('DOMContentLoaded', function() {{
                 pm = schedule.get('pm')
                 is_key = schedule.get('is_key_day', False)
                 is_strength = am == 'strength' or pm == 'strength'
+                # Session names are free text from the weekly structure
+                am_html = escape(str(am)) if am else ''
+                pm_html = escape(str(pm)) if pm else ''
                 
                 workouts = []
                 if am:
                     workout_class = 'strength' if am == 'strength' else ''
-                    workouts.append(f'<div class="atp-workout-item {workout_class}">{am.replace("_", " ").title()}</div>')
+                    workouts.append(f'<div class="atp-workout-item {workout_class}">{escape(str(am).replace("_", " ").title())}</div>')
                 if pm:
                     workout_class = 'strength' if pm == 'strength' else ''
-                    workouts.append(f'<div class="atp-workout-item {workout_class}">{pm.replace("_", " ").title()} (PM)</div>')
+                    workouts.append(f'<div class="atp-workout-item {workout_class}">{escape(str(pm).replace("_", " ").title())} (PM)</div>')
                 
                 if not workouts:
                     workouts.append('<div class="atp-workout-item" style="color: #999;">Rest</div>')
@@ -2086,7 +2877,7 @@ document.addEventListener('DOMContentLoaded', function() {{
                 day_class = 'key-day' if is_key else ('strength-day' if is_strength else '')
                 
                 # Create modal data
-                modal_data = f'data-week="{week}" data-day="{day_name}" data-phase="{phase}" data-am="{am or ""}" data-pm="{pm or ""}"'
+                modal_data = f'data-week="{week}" data-day="{day_name}" data-phase="{phase}" data-am="{am_html}" data-pm="{pm_html}"'
                 
                 day_cells.append(f'''
                     <div class="atp-day {day_class}" {modal_data} onclick="showWorkoutModal(this)">
@@ -2139,30 +2930,19 @@ document.addEventListener('DOMContentLoaded', function() {{
     
     def _generate_your_weekly_schedule(self) -> str:
         if not self.weekly_structure:
-            return '<section id="your-schedule"><h2>2 · Your Weekly Schedule</h2><p>Weekly structure not yet generated.</p></section>'
+            return ""
         
         days = self.weekly_structure.get('days', {})
-        rows = []
-        
-        for day_name in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']:
-            schedule = days.get(day_name, {})
-            am = schedule.get('am') or '—'
-            pm = schedule.get('pm') or '—'
-            is_key = schedule.get('is_key_day', False)
-            notes = schedule.get('notes', '')
-            
-            key_badge = '<span class="key-day">KEY</span>' if is_key else ''
-            
-            rows.append(f'''
-                <tr>
-                    <td><strong>{day_name.title()}</strong>{key_badge}</td>
-                    <td>{am}</td>
-                    <td>{pm}</td>
-                    <td>{notes}</td>
-                </tr>
-            ''')
-        
-        rows_html = "\n".join(rows)
+        rows_html = "\n".join(
+            _ROW_FMT.format(
+                day=day_name.title(),
+                badge=_KEY_BADGE if schedule.get('is_key_day', False) else '',
+                am=escape(str(schedule.get('am') or '—')),
+                pm=escape(str(schedule.get('pm') or '—')),
+                notes=escape(str(schedule.get('notes') or '')),
+            )
+            for day_name, schedule in ((d, days.get(d, {})) for d in _WEEKDAYS)
+        )
         
         key_days = self.derived.get('key_day_candidates', [])
         strength_days = self.derived.get('strength_day_candidates', [])
@@ -2176,269 +2956,87 @@ document.addEventListener('DOMContentLoaded', function() {{
     <table>
         <thead>
             <tr>
-                <th>Day</th>
-                <th>AM</th>
-                <th>PM</th>
-                <th>Notes</th>
-            </tr>
-        </thead>
-        <tbody>
-{rows_html}
-        </tbody>
-    </table>
-    
-    <h3>Priority Order</h3>
-    <p>When life gets in the way, prioritize in this order:</p>
-    <ol>
-        <li><strong>Key cycling sessions</strong> — These drive fitness gains</li>
-        <li><strong>Long ride</strong> — Builds endurance foundation</li>
-        <li><strong>Strength sessions</strong> — Injury prevention + power</li>
-        <li><strong>Easy rides</strong> — Recovery, can be shortened or skipped</li>
-    </ol>
-    
-    <div class="callout tip">
-        <h4>Your Key Days</h4>
-        <p><strong>Key cycling:</strong> {', '.join([d.title() for d in key_days]) or 'TBD'}</p>
-        <p><strong>Strength days:</strong> {', '.join([d.title() for d in strength_days]) or 'TBD'}</p>
-    </div>
-</section>
-'''
-    
-    def _generate_phase_progression(self) -> str:
-        plan_weeks = self.derived.get('plan_weeks', 12)
-        
-        # Calculate phase weeks based on plan length
-        if plan_weeks >= 20:
-            phases = [
-                ("Base", "1-4", "Learn to Lift"),
-                ("Build", "5-12", "Lift Heavy Sh*t"),
-                ("Peak", "13-18", "Lift Fast"),
-                ("Taper", "19-20", "Don't Lose It"),
-            ]
-        elif plan_weeks >= 12:
-            phases = [
-                ("Base", "1-3", "Learn to Lift"),
-                ("Build", "4-7", "Lift Heavy Sh*t"),
-                ("Peak", "8-10", "Lift Fast"),
-                ("Taper", "11-12", "Don't Lose It"),
-            ]
-        else:
-            phases = [
-                ("Base", "1-2", "Learn to Lift"),
-                ("Build", "3-4", "Lift Heavy Sh*t"),
-                ("Peak", f"5-{plan_weeks-1}", "Lift Fast"),
-                ("Taper", f"{plan_weeks}", "Don't Lose It"),
-            ]
-        
-        phase_cards = []
-        for cycling_phase, weeks, strength_phase in phases:
-            phase_cards.append(f'''
-<div class="phase-card">
-    <div class="phase-card-header">{cycling_phase} Phase — Weeks {weeks}</div>
-    <div class="phase-card-body">
-        <p><strong>Cycling:</strong> {self._get_cycling_phase_desc(cycling_phase)}</p>
-        <p><strong>Strength:</strong> {strength_phase}</p>
-    </div>
-</div>
-''')
-        
-        return f'''
-<section id="phase-progression">
-    <h2>3 · Your {plan_weeks}-Week Phase Progression</h2>
-    
-    <p>Your training progresses through four coordinated phases. Cycling and strength are aligned so you're not double-peaking.</p>
-    
-    {"".join(phase_cards)}
-    
-    <div class="callout alert">
-        <h4>Why Phase Alignment Matters</h4>
-        <p>Most training plans treat cycling and strength separately. You end up building max strength while also doing your highest cycling volume—a recipe for overtraining.</p>
-        <p>This plan coordinates them: when cycling load is highest (Build/Peak), strength shifts to power and maintenance. When cycling is easier (Base), strength builds foundation.</p>
-    </div>
-</section>
-'''
-    
-    def _get_cycling_phase_desc(self, phase: str) -> str:
-        descs = {
-            "Base": "Building aerobic foundation. Long Z2 rides. Establishing rhythm.",
-            "Build": "Adding intensity. Race-specific fitness. G-Spot work.",
-            "Peak": "Maximum training load. Race simulation. Proving readiness.",
-            "Taper": "Reducing volume, maintaining intensity. Arriving fresh."
-        }
-        return descs.get(phase, "Progressive training.")
-    
-    def _generate_training_fundamentals(self) -> str:
-        return '''
-<section id="training-fundamentals">
-    <h2>4 · Training Fundamentals</h2>
-    
-    <p>Before executing workouts, understand how training works at a mechanical level.</p>
-    
-    <h3>The Adaptation Cycle</h3>
-    
-    <div class="timeline">
-        <div class="timeline-item">
-            <div class="timeline-time">Step 1: Stress</div>
-            <p>You apply training stress—a workout that exceeds your current capacity. Muscle fibers develop microtears. Glycogen depletes. Your body registers this as a problem to solve.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">Step 2: Fatigue</div>
-            <p>Immediately after, you're weaker than before. This is normal. Fatigue is the signal that triggers adaptation.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">Step 3: Recovery</div>
-            <p>Given adequate rest, nutrition, and time, your body repairs: muscle fibers rebuild, mitochondria multiply, capillary density increases.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">Step 4: Supercompensation</div>
-            <p>Your body doesn't just return to baseline—it overshoots. You're now stronger than before.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">Step 5: Repeat</div>
-            <p>Apply slightly larger stress. The cycle repeats. Over weeks, these small adaptations compound into meaningful fitness gains.</p>
-        </div>
-    </div>
-    
-    <h3>The Practical Rules</h3>
-    <ol>
-        <li><strong>Training stress must be adequate but not excessive</strong> — Hard enough to trigger adaptation. Not so hard you can't recover.</li>
-        <li><strong>Recovery is training</strong> — Sleep, nutrition, stress management. This is where adaptation happens.</li>
-        <li><strong>Consistency compounds</strong> — Ten weeks of steady training beats four weeks of heroics followed by burnout.</li>
-        <li><strong>Patience is required</strong> — Meaningful adaptation takes weeks and months, not days.</li>
-    </ol>
-</section>
-'''
-    
-    def _generate_training_zones(self) -> str:
-        return '''
-<section id="training-zones">
-    <h2>5 · Training Zones</h2>
-    
-    <p>Zones quantify intensity. But the end goal of measuring intensity is to help you <strong>develop a feeling for intensity</strong>.</p>
-    
-    <table>
-        <thead>
-            <tr>
-                <th>Zone</th>
-                <th>Name</th>
-                <th>% FTP</th>
-                <th>Feel</th>
+                <th>Day</th>
+                <th>AM</th>
+                <th>PM</th>
+                <th>Notes</th>
             </tr>
         </thead>
         <tbody>
-            <tr>
-                <td><strong>Z1</strong></td>
-                <td>Active Recovery</td>
-                <td>&lt;55%</td>
-                <td>Very easy. Full conversation possible. Doesn't feel like training.</td>
-            </tr>
-            <tr>
-                <td><strong>Z2</strong></td>
-                <td>Endurance</td>
-                <td>56-75%</td>
-                <td>All-day pace. Can chat freely. <strong>Most of your training lives here.</strong></td>
-            </tr>
-            <tr>
-                <td><strong>Z3</strong></td>
-                <td>Tempo</td>
-                <td>76-87%</td>
-                <td>Comfortably hard. Talking in short sentences.</td>
-            </tr>
-            <tr class="zone-row-gspot">
-                <td><strong>G-Spot</strong></td>
-                <td>Gravel Race Pace</td>
-                <td>88-92%</td>
-                <td>Uncomfortably sustainable. Hard enough to hurt, easy enough to repeat.</td>
-            </tr>
-            <tr>
-                <td><strong>Z4</strong></td>
-                <td>Threshold</td>
-                <td>93-105%</td>
-                <td>Hard, controlled. Can only say a few words.</td>
-            </tr>
-            <tr>
-                <td><strong>Z5</strong></td>
-                <td>VO2max</td>
-                <td>106-120%</td>
-                <td>Very hard. Near maximum. Speech impossible.</td>
-            </tr>
-            <tr>
-                <td><strong>Z6</strong></td>
-                <td>Anaerobic</td>
-                <td>121-150%</td>
-                <td>All-out. 30 seconds to 3 minutes max.</td>
-            </tr>
+{rows_html}
         </tbody>
     </table>
     
-    <div class="callout alert">
-        <h4>The Most Common Mistake</h4>
-        <p><strong>Easy means easy.</strong> Most people train too hard on easy days. Z2 should feel genuinely conversational. If you're breathing hard, you're in Z3.</p>
-        <p>Fix this. It's the most common training mistake.</p>
-    </div>
+    <h3>Priority Order</h3>
+    <p>When life gets in the way, prioritize in this order:</p>
+    <ol>
+        <li><strong>Key cycling sessions</strong> — These drive fitness gains</li>
+        <li><strong>Long ride</strong> — Builds endurance foundation</li>
+        <li><strong>Strength sessions</strong> — Injury prevention + power</li>
+        <li><strong>Easy rides</strong> — Recovery, can be shortened or skipped</li>
+    </ol>
     
-    <h3>When Devices and Body Conflict</h3>
-    <p>Power meters can lie (bad calibration, stale FTP). Heart rate can be misleading (heat, dehydration, caffeine, illness).</p>
-    <p><strong>Your body doesn't lie.</strong> If 90% FTP feels like 9/10 today when it should feel like 7/10, something's wrong. Trust your body.</p>
+    <div class="callout tip">
+        <h4>Your Key Days</h4>
+        <p><strong>Key cycling:</strong> {', '.join(d.title() for d in key_days) or 'TBD'}</p>
+        <p><strong>Strength days:</strong> {', '.join(d.title() for d in strength_days) or 'TBD'}</p>
+    </div>
 </section>
 '''
     
-    def _generate_workout_execution(self) -> str:
-        return '''
-<section id="workout-execution">
-    <h2>6 · Workout Execution</h2>
-    
-    <p>There's a massive gap between what's written on the plan and what actually happens. This section teaches you how to close that gap.</p>
-    
-    <h3>Universal Rules</h3>
+    def _generate_phase_progression(self) -> str:
+        plan_weeks = self._plan_weeks
+        
+        # Calculate phase weeks based on plan length
+        if plan_weeks >= 20:
+            phases = _PHASES_GE20
+        elif plan_weeks >= 12:
+            phases = _PHASES_GE12
+        else:
+            phases = [
+                ("Base", "1-2", "Learn to Lift"),
+                ("Build", "3-4", "Lift Heavy Sh*t"),
+                ("Peak", f"5-{plan_weeks-1}", "Lift Fast"),
+                ("Taper", f"{plan_weeks}", "Don't Lose It"),
+            ]
+        
+        phase_cards_html = "".join(
+            _PHASE_CARD_TMPL.format(
+                cycling_phase=cycling_phase,
+                weeks=weeks,
+                desc=_CYCLING_PHASE_DESC.get(cycling_phase, "Progressive training."),
+                strength_phase=strength_phase,
+            )
+            for cycling_phase, weeks, strength_phase in phases
+        )
+        
+        return f'''
+<section id="phase-progression">
+    <h2>3 · Your {plan_weeks}-Week Phase Progression</h2>
     
-    <h4>1. Warm Up Properly</h4>
-    <p>For intensity sessions: 15-20 minutes Z1→Z2→Z3. Include 3×1 min at Z3-Z4 to "open the legs." 2-3 minutes easy spin before first work interval.</p>
+    <p>Your training progresses through four coordinated phases. Cycling and strength are aligned so you're not double-peaking.</p>
     
-    <h4>2. Do the Actual Workout</h4>
-    <p>Execute what's prescribed. Not more. Not less. Adding volume or intensity might feel productive, but it accumulates fatigue and ruins tomorrow's workout.</p>
+    {phase_cards_html}
     
-    <h4>3. Chase Time-in-Zone, Not Hero Intervals</h4>
-    <p>The goal is highest average power across the entire set, not crushing the first interval then dying.</p>
+    <div class="callout alert">
+        <h4>Why Phase Alignment Matters</h4>
+        <p>Most training plans treat cycling and strength separately. You end up building max strength while also doing your highest cycling volume—a recipe for overtraining.</p>
+        <p>This plan coordinates them: when cycling load is highest (Build/Peak), strength shifts to power and maintenance. When cycling is easier (Base), strength builds foundation.</p>
+    </div>
+</section>
+'''
     
-    <table>
-        <thead>
-            <tr>
-                <th>Bad Execution</th>
-                <th>Good Execution</th>
-            </tr>
-        </thead>
-        <tbody>
-            <tr>
-                <td>
-                    Interval 1: 320W (way too hard)<br>
-                    Interval 2: 290W (struggling)<br>
-                    Interval 3: 270W (barely hanging on)<br>
-                    Interval 4: Failed<br>
-                    <strong>Total: 3 intervals, 293W avg</strong>
-                </td>
-                <td>
-                    Interval 1: 300W (controlled)<br>
-                    Interval 2: 300W (harder but doable)<br>
-                    Interval 3: 295W (hardest one)<br>
-                    Interval 4: 295W (finished strong)<br>
-                    <strong>Total: 4 intervals, 297.5W avg</strong>
-                </td>
-            </tr>
-        </tbody>
-    </table>
+    def _generate_training_fundamentals(self) -> str:
+        return _FUNDAMENTALS_HTML
     
-    <h4>4. Stop If Power Drops >10%</h4>
-    <p>Quality beats quantity. Four quality intervals at 300W beats six degraded intervals averaging 270W.</p>
+    def _generate_training_zones(self) -> str:
+        return _ZONES_HTML
     
-    <h3>Indoor vs Outdoor</h3>
-    <p><strong>Ride indoors:</strong> Interval sessions, short workouts (&lt;90 min), bad weather, time-crunched days.</p>
-    <p><strong>Ride outdoors:</strong> Long endurance rides (2+ hours), skills practice, mental freshness, race-specific terrain.</p>
-</section>
-'''
+    def _generate_workout_execution(self) -> str:
+        return _EXECUTION_HTML
     
     def _generate_strength_program(self) -> str:
-        strength_freq = self.derived.get('strength_frequency', 2)
+        strength_freq = self._strength_freq
         exclusions = self.derived.get('exercise_exclusions', [])
         equipment = self.profile.get('strength_equipment', [])
         
@@ -2555,107 +3153,13 @@ document.addEventListener('DOMContentLoaded', function() {{
 '''
     
     def _generate_fueling_hydration(self) -> str:
-        return '''
-<section id="fueling">
-    <h2>8 · Fueling & Hydration</h2>
-    
-    <p>You can have perfect training, a dialed bike, and excellent pacing strategy. None of it matters if you run out of fuel halfway through.</p>
-    
-    <h3>Quick Reference</h3>
-    <table>
-        <thead>
-            <tr>
-                <th>Scenario</th>
-                <th>Carbs</th>
-                <th>Fluid</th>
-            </tr>
-        </thead>
-        <tbody>
-            <tr><td>Training &lt;2 hours</td><td>30-45g/hour</td><td>500-750ml/hour</td></tr>
-            <tr><td>Training 2-4 hours</td><td>45-60g/hour</td><td>500-750ml/hour</td></tr>
-            <tr><td>Long ride 4-6 hours</td><td>60-75g/hour</td><td>500-750ml/hour</td></tr>
-            <tr><td>Race day</td><td>60-90g/hour</td><td>500-750ml/hour</td></tr>
-            <tr><td>Hot conditions (&gt;80°F)</td><td>60-90g/hour</td><td>750-1000ml/hour</td></tr>
-        </tbody>
-    </table>
-    
-    <h3>Daily Nutrition</h3>
-    <ul>
-        <li><strong>Protein:</strong> 1.6-2.2g per kg bodyweight</li>
-        <li><strong>Carbs:</strong> 3-7g per kg (depends on training volume)</li>
-        <li><strong>Fat:</strong> 0.8-1.2g per kg bodyweight</li>
-    </ul>
-    
-    <h3>Race Day Fueling</h3>
-    <p><strong>Pre-race (3-4 hours before):</strong> 2-3g carbs per kg. Familiar foods only.</p>
-    <p><strong>During race:</strong> Start fueling at 30 minutes. 70-80g carbs per hour. <strong>Set a timer.</strong></p>
-    
-    <div class="callout alert">
-        <h4>When Your Stomach Rebels</h4>
-        <ol>
-            <li>Back off intensity for 5-10 minutes</li>
-            <li>Switch to liquid calories temporarily</li>
-            <li>Small sips, not big gulps</li>
-            <li>Don't panic and stop eating entirely—you'll bonk</li>
-        </ol>
-    </div>
-    
-    <h3>Train Your Gut</h3>
-    <p>Your gut is trainable. If you never eat during training rides, your gut won't tolerate eating during races. Practice fueling on every long ride.</p>
-</section>
-'''
+        return _FUELING_HTML
     
     def _generate_mental_training(self) -> str:
-        return '''
-<section id="mental-training">
-    <h2>9 · Mental Training</h2>
-    
-    <p>Physical training builds the engine. Mental training determines whether you use that engine when things get hard.</p>
-    
-    <h3>6-2-7 Breathing Technique</h3>
-    <p><strong>The pattern:</strong> Inhale 6 seconds, hold 2 seconds, exhale 7 seconds.</p>
-    <p>The key is the exhale is longer than inhale—this triggers the calming response.</p>
-    <p><strong>Use it for:</strong> Pre-race anxiety, mid-race panic, after a bad section.</p>
-    
-    <h3>Performance Statements</h3>
-    <p>Pre-planned phrases that replace negative self-talk:</p>
-    
-    <table>
-        <thead>
-            <tr>
-                <th>Type</th>
-                <th>Examples</th>
-            </tr>
-        </thead>
-        <tbody>
-            <tr>
-                <td><strong>Technical cues</strong></td>
-                <td>"Smooth pedal stroke" • "Relax your shoulders" • "Light hands"</td>
-            </tr>
-            <tr>
-                <td><strong>Pain responses</strong></td>
-                <td>"This is supposed to be hard" • "Pain is temporary, quitting is permanent"</td>
-            </tr>
-            <tr>
-                <td><strong>Process statements</strong></td>
-                <td>"Just get to the next aid station" • "One more climb" • "Next mile marker"</td>
-            </tr>
-        </tbody>
-    </table>
-    
-    <h3>Personal Highlight Reel</h3>
-    <p>Build a mental movie you can play to access confidence:</p>
-    <ol>
-        <li><strong>Scene 1:</strong> A past moment when you overcame something difficult</li>
-        <li><strong>Scene 2:</strong> A future crucial moment in this race—see yourself executing perfectly</li>
-        <li><strong>Scene 3:</strong> Crossing the finish line—in full sensory detail</li>
-    </ol>
-    <p>Practice until you can trigger the confident feeling on demand.</p>
-</section>
-'''
+        return _MENTAL_HTML
     
     def _generate_race_tactics(self) -> str:
-        race_name = self._get_race_name()
+        race_name = self._race_name_html
         
         return f'''
 <section id="race-tactics">
@@ -2734,41 +3238,16 @@ document.addEventListener('DOMContentLoaded', function() {{
 '''
     
     def _generate_race_week(self) -> str:
-        return '''
+        return f'''
 <section id="race-week">
     <h2>11 · Race Week Protocol</h2>
     
-    <p>By race week, the training is done. You can't add fitness—you can only preserve what you've built or add dumb fatigue through poor decisions.</p>
-    
-    <h3>Race Morning Timeline</h3>
-    
-    <div class="timeline">
-        <div class="timeline-item">
-            <div class="timeline-time">3-4 Hours Before</div>
-            <p>Wake up. Eat familiar, high-carb, low-fiber breakfast. Target 1-2g carbs per kg.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">2 Hours Before</div>
-            <p>Arrive at venue. Set up bike and gear. Use bathroom. Begin sipping fluids.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">1 Hour Before</div>
-            <p>Final bike check: tire pressure, brakes, shifting. Short warm-up spin. Start pre-race nutrition (100-200 cal carbs).</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">30 Minutes Before</div>
-            <p>Run through highlight reel visualization. Review performance statements. Begin settling mind.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">10 Minutes Before</div>
-            <p>6-2-7 breathing. Find your spot. Check nutrition is accessible.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">Start</div>
-            <p>Controlled effort. Find sustainable rhythm. First gel at 20 minutes, not 60.</p>
-        </div>
-    </div>
-    
+    <p>By race week, the training is done. You can't add fitness—you can only preserve what you've built or add dumb fatigue through poor decisions.</p>
+    
+    <h3>Race Morning Timeline</h3>
+    
+    {_timeline(_RACE_MORNING)}
+    
     <div class="callout tip">
         <h4>Race Week Rule</h4>
         <p>Less is more. You've done the work. Now let your body absorb it. Show up fresh, not fatigued from last-minute training.</p>
@@ -2777,7 +3256,7 @@ document.addEventListener('DOMContentLoaded', function() {{
 '''
     
     def _generate_masters_section(self) -> str:
-        age = self._calculate_age()
+        age = self._age
         return f'''
 <section id="masters">
     <h2>12 · Masters-Specific Considerations</h2>
@@ -2926,7 +3405,7 @@ document.addEventListener('DOMContentLoaded', function() {{
             10
         )
         
-        age = self._calculate_age() or self.profile.get('health_factors', {}).get('age') or 35
+        age = self._age or self.profile.get('health_factors', {}).get('age') or 35
         sex = self.profile.get('sex', 'male').lower()
         
         # Activity level from lifestyle questionnaire
@@ -3018,6 +3497,65 @@ document.addEventListener('DOMContentLoaded', function() {{
         elif weight_goal == 'gain':
             weight_note = "Includes 300 kcal surplus for muscle building."
         
+        sample_timing = [
+            ('2-3 Hours Before',
+             f'<strong>Pre-workout meal:</strong> {int(weight_kg * 1)}-{int(weight_kg * 2)}g carbs + light protein. Low fiber, low fat. Oatmeal + banana + honey, or toast + peanut butter.'),
+            ('15-30 Minutes Before',
+             '<strong>Quick snack (optional):</strong> 20-30g fast carbs. Banana or gel. Skip if you ate well 2-3 hours prior.'),
+            ('During Session (if &gt;90 min)',
+             '<strong>Start at 30 minutes:</strong> 60-80g carbs/hour. Set a timer. Mix liquids + solids. Use 2:1 glucose:fructose if exceeding 60g/hour.'),
+        ]
+        
+        # Post-workout recovery protocol only matters with hard sessions back-to-back
+        recovery_html = ""
+        if self.needs_recovery_nutrition:
+            sample_timing.append(
+                ('Within 30 Minutes After',
+                 f'<strong>Recovery (if long/hard + training again within 24-36hrs):</strong> 20-30g protein + {int(weight_kg * 1)}-{int(weight_kg * 1.5)}g carbs. Recovery shake or chocolate milk. Window is smaller than you think.'))
+            recovery_html = f'''
+    <div class="callout alert">
+        <h4>Post-Workout Recovery</h4>
+        <p><strong>Only needed if:</strong> Workout was long (2.5+ hours) AND hard, AND you have another hard session within 24-36 hours.</p>
+        
+        <table style="margin: 12px 0;">
+            <thead>
+                <tr>
+                    <th>Timing</th>
+                    <th>Protein</th>
+                    <th>Carbs</th>
+                    <th>Examples</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td><strong>Within 30 minutes</strong><br><span style="font-size: 10px; color: #666;">Critical window</span></td>
+                    <td>20-30g</td>
+                    <td>1-1.5g/kg<br>({int(weight_kg * 1)}-{int(weight_kg * 1.5)}g)</td>
+                    <td>Recovery shake, chocolate milk</td>
+                </tr>
+                <tr>
+                    <td><strong>Within 1-2 hours</strong></td>
+                    <td>Full meal</td>
+                    <td>Full meal</td>
+                    <td>Protein + carbs + vegetables</td>
+                </tr>
+            </tbody>
+        </table>
+        
+        <p><strong>If workout was easy, short, or next hard session is 48+ hours away:</strong></p>
+        <ul style="margin: 8px 0;">
+            <li>Just eat your next meal normally</li>
+            <li>Recovery nutrition is optional</li>
+            <li>Don't overthink it</li>
+        </ul>
+        
+        <p style="font-size: 11px; margin-top: 8px; color: #666;"><strong>Rule:</strong> The more frequently you train hard, the more critical recovery nutrition becomes. If training once per day with easy sessions, skip the fancy protocols and just eat dinner.</p>
+    </div>
+'''
+        sample_timing.append(
+            ('Within 1-2 Hours After',
+             '<strong>Full meal:</strong> Balanced meal with protein, carbs, vegetables. Continue normal eating pattern throughout the day.'))
+        
         return f'''
 <section id="nutrition">
     <h2>Your Nutrition Targets</h2>
@@ -3110,131 +3648,16 @@ document.addEventListener('DOMContentLoaded', function() {{
         <p style="font-size: 11px; margin-top: 8px; color: #666;"><strong>Rule:</strong> Hard sessions need fuel. Easy sessions are flexible.</p>
     </div>
     
-    <div class="callout tip">
-        <h4>During Training — The 60-80g Per Hour Rule</h4>
-        <p>For any ride <strong>over 90 minutes at moderate-to-high intensity (Z3+)</strong>, you need <strong>60-80g of carbohydrates per hour.</strong></p>
-        <p style="font-size: 12px; color: #666;">Your gut can absorb ~60g glucose/hour. Add fructose (different transporters) to reach 90g. Sweet spot: 70-75g/hour.</p>
-        
-        <table style="margin: 12px 0;">
-            <thead>
-                <tr>
-                    <th>Session Type</th>
-                    <th>Duration</th>
-                    <th>Carbs/Hour</th>
-                    <th>When to Start</th>
-                    <th>What to Use</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Z2 Endurance</td>
-                    <td>2-4 hours</td>
-                    <td>40-60g</td>
-                    <td>After 60 min</td>
-                    <td>Real food: PB&J, bananas, bars</td>
-                </tr>
-                <tr>
-                    <td>Tempo/G-Spot</td>
-                    <td>2-3 hours</td>
-                    <td>60-80g</td>
-                    <td>Start at 30-45 min</td>
-                    <td>Mix: liquids + solids</td>
-                </tr>
-                <tr>
-                    <td>Threshold/VO2max</td>
-                    <td>60-90 min</td>
-                    <td>Pre-workout sufficient<br>+ 1 gel mid-session</td>
-                    <td>Between efforts</td>
-                    <td>Gel or sports drink</td>
-                </tr>
-                <tr>
-                    <td>Race/Long hard</td>
-                    <td>&gt;90 min</td>
-                    <td>60-90g</td>
-                    <td>Start at 30 min</td>
-                    <td>Mix: drinks + gels/chews<br>(2:1 glucose:fructose if &gt;60g)</td>
-                </tr>
-            </tbody>
-        </table>
-        <p style="font-size: 11px; margin-top: 8px; color: #666;"><strong>Critical:</strong> Start fueling at 30 minutes, not 60. By the time you feel hungry, you're already behind. Set a timer.</p>
-    </div>
-    
-    <div class="callout alert">
-        <h4>Post-Workout Recovery</h4>
-        <p><strong>Only needed if:</strong> Workout was long (2.5+ hours) AND hard, AND you have another hard session within 24-36 hours.</p>
-        
-        <table style="margin: 12px 0;">
-            <thead>
-                <tr>
-                    <th>Timing</th>
-                    <th>Protein</th>
-                    <th>Carbs</th>
-                    <th>Examples</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td><strong>Within 30 minutes</strong><br><span style="font-size: 10px; color: #666;">Critical window</span></td>
-                    <td>20-30g</td>
-                    <td>1-1.5g/kg<br>({int(weight_kg * 1)}-{int(weight_kg * 1.5)}g)</td>
-                    <td>Recovery shake, chocolate milk</td>
-                </tr>
-                <tr>
-                    <td><strong>Within 1-2 hours</strong></td>
-                    <td>Full meal</td>
-                    <td>Full meal</td>
-                    <td>Protein + carbs + vegetables</td>
-                </tr>
-            </tbody>
-        </table>
-        
-        <p><strong>If workout was easy, short, or next hard session is 48+ hours away:</strong></p>
-        <ul style="margin: 8px 0;">
-            <li>Just eat your next meal normally</li>
-            <li>Recovery nutrition is optional</li>
-            <li>Don't overthink it</li>
-        </ul>
-        
-        <p style="font-size: 11px; margin-top: 8px; color: #666;"><strong>Rule:</strong> The more frequently you train hard, the more critical recovery nutrition becomes. If training once per day with easy sessions, skip the fancy protocols and just eat dinner.</p>
-    </div>
+    {_DURING_TRAINING_CALLOUT}
     
+{recovery_html}
     <h4>Sample Timing Schedule (Hard Session)</h4>
     
-    <div class="timeline">
-        <div class="timeline-item">
-            <div class="timeline-time">2-3 Hours Before</div>
-            <p><strong>Pre-workout meal:</strong> {int(weight_kg * 1)}-{int(weight_kg * 2)}g carbs + light protein. Low fiber, low fat. Oatmeal + banana + honey, or toast + peanut butter.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">15-30 Minutes Before</div>
-            <p><strong>Quick snack (optional):</strong> 20-30g fast carbs. Banana or gel. Skip if you ate well 2-3 hours prior.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">During Session (if &gt;90 min)</div>
-            <p><strong>Start at 30 minutes:</strong> 60-80g carbs/hour. Set a timer. Mix liquids + solids. Use 2:1 glucose:fructose if exceeding 60g/hour.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">Within 30 Minutes After</div>
-            <p><strong>Recovery (if long/hard + training again within 24-36hrs):</strong> 20-30g protein + {int(weight_kg * 1)}-{int(weight_kg * 1.5)}g carbs. Recovery shake or chocolate milk. Window is smaller than you think.</p>
-        </div>
-        <div class="timeline-item">
-            <div class="timeline-time">Within 1-2 Hours After</div>
-            <p><strong>Full meal:</strong> Balanced meal with protein, carbs, vegetables. Continue normal eating pattern throughout the day.</p>
-        </div>
-    </div>
+    {_timeline(sample_timing)}
     
     <p style="font-size: 12px; color: #666; margin-top: 16px;"><strong>Note:</strong> For easy sessions (&lt;90 min Z2), timing is flexible. Eat normally, or even train fasted. Recovery nutrition is optional unless you're training twice per day.</p>
     
-    <div class="callout tip">
-        <h4>Common Timing Mistakes</h4>
-        <ul style="margin: 8px 0;">
-            <li><strong>Waiting until hungry to fuel</strong> — By then it's too late. Set a timer.</li>
-            <li><strong>Skipping pre-workout meal</strong> — You'll bonk mid-session. Eat 2-3 hours before.</li>
-            <li><strong>Not eating post-workout</strong> — Recovery window closes fast. Eat within 60 minutes.</li>
-            <li><strong>Trying new foods on race day</strong> — Test everything in training first.</li>
-            <li><strong>Overthinking it</strong> — Simple carbs before/during, protein+carbs after. That's 90% of it.</li>
-        </ul>
-    </div>
+    {_TIMING_MISTAKES_CALLOUT}
     
     <h3>Day-Type Adjustments</h3>
     <table>
@@ -3307,11 +3730,7 @@ document.addEventListener('DOMContentLoaded', function() {{
         </tbody>
     </table>
     
-    <div class="callout tip">
-        <h4>Fuel the Work</h4>
-        <p><strong>Common mistake:</strong> Eating less to lose weight during hard training blocks.</p>
-        <p><strong>Reality:</strong> Underfueling impairs adaptation, increases injury risk, and tanks performance. Eat for the work you're doing. Weight management happens in easy phases, not build phases.</p>
-    </div>
+    {_FUEL_THE_WORK_CALLOUT}
     
     <h3>Interactive Nutrition Calculator</h3>
     <p>Adjust these sliders to see how your daily targets change based on different scenarios:</p>
@@ -3743,179 +4162,10 @@ document.addEventListener('DOMContentLoaded', function() {{
 '''
     
     def _generate_footer(self) -> str:
-        first_name = self._get_first_name()
-        plan_weeks = self.derived.get('plan_weeks', 12)
+        first_name = self._first_name_html
+        plan_weeks = self._plan_weeks
         
-        # Add workout modal
-        modal_html = '''
-<!-- Workout Detail Modal -->
-<div class="workout-modal" id="workoutModal" onclick="if(event.target === this) closeWorkoutModal()">
-    <div class="workout-modal-content">
-        <div class="workout-modal-header">
-            <h3 id="modalTitle">Workout Details</h3>
-            <button class="workout-modal-close" onclick="closeWorkoutModal()">×</button>
-        </div>
-        <div id="modalBody">
-            <!-- Populated by JavaScript -->
-        </div>
-    </div>
-</div>
-
-<script>
-// Workout descriptions by type
-const workoutDescriptions = {
-    'strength': {
-        title: 'Strength Session',
-        duration: '45-60 min',
-        description: 'Full-body strength workout targeting cycling-specific muscle groups.',
-        instructions: [
-            'Watch video demos before new exercises',
-            'Complete warm-up activation circuit first',
-            'Rest 60-120s between sets (longer for heavy sets)',
-            'Stop if form breaks down',
-            'Log weights for progressive overload tracking'
-        ],
-        file: 'Check your ZWO files for the specific workout'
-    },
-    'intervals': {
-        title: 'Interval Session',
-        duration: '60-90 min',
-        description: 'Structured intensity work targeting specific energy systems.',
-        instructions: [
-            '15-20 min warm-up before first interval',
-            'Hit target power, don\\'t exceed it',
-            'If you can\\'t complete reps, reduce target by 5%',
-            'Full recovery between sets',
-            'Easy spin cool-down'
-        ],
-        zones: 'Varies by phase — check specific workout'
-    },
-    'easy_ride': {
-        title: 'Easy / Recovery Ride',
-        duration: '45-90 min',
-        description: 'Truly easy spinning to promote recovery without adding fatigue.',
-        instructions: [
-            'Zone 1-2 only — this should feel embarrassingly easy',
-            'Conversation pace throughout',
-            'No Strava segments, no chasing groups',
-            'Purpose is recovery, not fitness',
-            'If HR drifts into Z3, slow down'
-        ],
-        zones: 'Z1-Z2 (<75% FTP)'
-    },
-    'long_ride': {
-        title: 'Long Endurance Ride',
-        duration: '2.5-5+ hours',
-        description: 'Building aerobic base and time-in-saddle.',
-        instructions: [
-            'Mostly Z2 with natural terrain variation',
-            'Practice race nutrition (target 60-80g carbs/hour)',
-            'Include some Z3 efforts if terrain demands',
-            'Build mental fortitude for long efforts',
-            'This is where endurance adaptations happen'
-        ],
-        zones: 'Z2 primary (65-75% FTP), Z3 ok on climbs'
-    },
-    'tempo': {
-        title: 'Tempo Ride',
-        duration: '60-90 min',
-        description: 'Sustained moderate effort building muscular endurance.',
-        instructions: [
-            'Main set at 76-87% FTP (Z3)',
-            'Should feel comfortably hard',
-            'Can talk in short sentences',
-            'Don\\'t let it creep into threshold',
-            'Good for building fatigue resistance'
-        ],
-        zones: 'Z3 (76-87% FTP)'
-    },
-    'rest': {
-        title: 'Rest Day',
-        duration: '0 min',
-        description: 'Complete rest — no training.',
-        instructions: [
-            'No cycling (not even "easy")',
-            'Light walking/stretching is fine',
-            'Focus on sleep and nutrition',
-            'This is where adaptation happens',
-            'Don\\'t feel guilty — rest IS training'
-        ]
-    }
-};
-
-function showWorkoutModal(element) {
-    const week = element.dataset.week;
-    const day = element.dataset.day;
-    const phase = element.dataset.phase;
-    const am = element.dataset.am;
-    const pm = element.dataset.pm;
-    
-    const modal = document.getElementById('workoutModal');
-    const title = document.getElementById('modalTitle');
-    const body = document.getElementById('modalBody');
-    
-    // Get workout info
-    const workoutType = (am || 'rest').toLowerCase().replace(/ /g, '_');
-    const workout = workoutDescriptions[workoutType] || workoutDescriptions['easy_ride'];
-    
-    title.textContent = `Week ${week} · ${day.charAt(0).toUpperCase() + day.slice(1)} · ${workout.title}`;
-    
-    let html = `
-        <div class="workout-detail">
-            <div class="workout-detail-label">Phase</div>
-            <div>${phase}</div>
-        </div>
-        <div class="workout-detail">
-            <div class="workout-detail-label">Duration</div>
-            <div>${workout.duration}</div>
-        </div>
-        <div class="workout-detail">
-            <div class="workout-detail-label">Description</div>
-            <div>${workout.description}</div>
-        </div>
-    `;
-    
-    if (workout.zones) {
-        html += `
-        <div class="workout-detail">
-            <div class="workout-detail-label">Target Zones</div>
-            <div>${workout.zones}</div>
-        </div>
-        `;
-    }
-    
-    html += `
-        <div class="workout-detail">
-            <div class="workout-detail-label">Execution Notes</div>
-            <ul style="margin: 8px 0 0 0; padding-left: 20px;">
-                ${workout.instructions.map(i => `<li>${i}</li>`).join('')}
-            </ul>
-        </div>
-    `;
-    
-    if (pm) {
-        html += `
-        <div class="workout-detail" style="margin-top: 16px; padding-top: 12px; border-top: 1px dashed #ddd;">
-            <div class="workout-detail-label">PM Session</div>
-            <div>${pm.replace(/_/g, ' ')}</div>
-        </div>
-        `;
-    }
-    
-    body.innerHTML = html;
-    modal.classList.add('open');
-}
-
-function closeWorkoutModal() {
-    document.getElementById('workoutModal').classList.remove('open');
-}
-
-// Close on Escape key
-document.addEventListener('keydown', function(e) {
-    if (e.key === 'Escape') closeWorkoutModal();
-});
-</script>
-'''
+        modal_html = _WORKOUT_MODAL_HTML if self.has_pm_sessions else _WORKOUT_MODAL_HTML_AM_ONLY
         
         return f'''
 {modal_html}
@@ -3927,7 +4177,7 @@ document.addEventListener('keydown', function(e) {
     <p>Not perfectly. Not heroically. Consistently. Intelligently. Over {plan_weeks} weeks.</p>
     <p>Show up for the workouts. Do them correctly. Recover properly. Trust the process.</p>
     <p style="font-size: 20px; margin-top: 32px;"><strong>Let's get after it, {first_name}.</strong></p>
-    <p style="font-size: 11px; color: #666; margin-top: 24px;">Generated {datetime.now().strftime('%B %d, %Y')} • Gravel God Cycling</p>
+    <p style="font-size: 11px; color: #666; margin-top: 24px;">Generated {_TODAY_STR} • Gravel God Cycling</p>
 </footer>
 '''
 
@@ -3939,19 +4189,54 @@ document.addEventListener('keydown', function(e) {
 def generate_html_guide(athlete_id: str, output_path: Optional[Path] = None) -> Path:
     """Generate HTML training guide for an athlete."""
     generator = GuideGenerator(athlete_id)
-    html = generator.generate()
     
     if output_path is None:
         output_path = Path(f"athletes/{athlete_id}/plans/current/training_guide.html")
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        f.write(html)
+    # Stream sections into a sibling temp file so a failed run never leaves a
+    # half-written guide in place of the previous one
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            generator.generate_to_binary(f)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     
     return output_path
 
 
+def _one(athlete_id: str) -> str:
+    return GuideGenerator(athlete_id).generate()
+
+
+def generate_many(athlete_ids: List[str]) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+    """Generate guides for several athletes in parallel.
+
+    Each guide is independent and CPU-bound, so athletes are spread over worker
+    processes rather than threads. Returns (guides, failures), both keyed by
+    athlete ID; one athlete failing doesn't discard the others.
+    """
+    guides: Dict[str, str] = {}
+    failures: Dict[str, Exception] = {}
+    if not athlete_ids:
+        return guides, failures
+    
+    workers = min(os.cpu_count() or 1, len(athlete_ids))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = {ex.submit(_one, aid): aid for aid in athlete_ids}
+        for future in as_completed(futures):
+            athlete_id = futures[future]
+            try:
+                guides[athlete_id] = future.result()
+            except Exception as e:
+                failures[athlete_id] = e
+    return guides, failures
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python generate_html_guide.py <athlete_id> [output_path]")
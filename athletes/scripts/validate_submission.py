@@ -5,14 +5,24 @@ Validates form data before creating athlete profile.
 """
 
 import json
+import math
+import sqlite3
 import sys
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Disposable email providers (common ones)
-DISPOSABLE_EMAIL_PROVIDERS = [
+DISPOSABLE_EMAIL_PROVIDERS = frozenset({
     '10minutemail.com',
     'guerrillamail.com',
     'tempmail.com',
@@ -23,112 +33,180 @@ DISPOSABLE_EMAIL_PROVIDERS = [
     'fakeinbox.com',
     'trashmail.com',
     'maildrop.cc'
-]
+})
+
+
+class _BloomFilter:
+    """Bit-array membership filter: may report false positives, never false negatives."""
+    
+    def __init__(self, items, error_rate: float = 0.01):
+        n = max(len(items), 1)
+        self._m = math.ceil(-n * math.log(error_rate) / math.log(2) ** 2)
+        self._k = max(1, round(self._m / n * math.log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+        for item in items:
+            for pos in self._positions(item):
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def _positions(self, item: str):
+        # Double hashing from the two halves of one 64-bit hash
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return ((h1 + i * h2) % self._m for i in range(self._k))
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+# Below this many domains the frozenset alone is smaller and faster
+_BLOOM_MIN_SIZE = 10_000
+
+_DISPOSABLE_BLOOM = (
+    _BloomFilter(DISPOSABLE_EMAIL_PROVIDERS)
+    if len(DISPOSABLE_EMAIL_PROVIDERS) >= _BLOOM_MIN_SIZE else None
+)
+
+# Rate limit store: one submission counter per email per day (YYYY-MM-DD)
+RATE_LIMIT_DB = Path('.github/rate-limits.sqlite3')
+
+# Seconds a concurrent validator waits for the write lock before giving up
+RATE_LIMIT_BUSY_TIMEOUT = 10.0
+
+# local@domain.tld with no whitespace; \Z so a trailing newline doesn't pass
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+\Z')
+
+# Weekly volume as hours, a range, or open-ended: "10", "9-12", "20+"
+_VOLUME_RE = re.compile(r'^(\d+)(?:-(\d+))?(\+)?\Z')
+
+_REQUIRED_FIELDS = ('name', 'email', 'primary_goal')
+
+_DAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
 
-# Rate limit file
-RATE_LIMIT_FILE = Path('.github/rate-limits.json')
+# Form checkboxes for training availability
+_DAY_AVAIL_KEYS = tuple(f'{day}_available' for day in _DAYS)
 
 
+@lru_cache(maxsize=4096)
 def is_disposable_email(email: str) -> bool:
-    """Check if email is from disposable provider."""
-    domain = email.split('@')[1].lower() if '@' in email else ''
+    """Check if email is from disposable provider.
+    
+    Cached per address; call is_disposable_email.cache_clear() after changing
+    DISPOSABLE_EMAIL_PROVIDERS.
+    """
+    _, sep, domain = email.rpartition('@')
+    if not sep:
+        return False
+    domain = domain.lower()
+    # Most domains are legitimate; let the filter reject them before the big set
+    if _DISPOSABLE_BLOOM is not None and domain not in _DISPOSABLE_BLOOM:
+        return False
     return domain in DISPOSABLE_EMAIL_PROVIDERS
 
 
-def check_rate_limit(email: str, max_per_day: int = 5) -> bool:
-    """Check if email has exceeded rate limit."""
-    if not RATE_LIMIT_FILE.exists():
-        return True  # No limit file, allow
-    
-    try:
-        with open(RATE_LIMIT_FILE, 'r') as f:
-            rate_limits = json.load(f)
-    except:
-        return True  # Error reading, allow
-    
-    today = datetime.now().strftime('%Y-%m-%d')
-    email_key = email.lower()
-    
-    if email_key not in rate_limits:
-        return True  # New email, allow
-    
-    submissions = rate_limits[email_key].get(today, [])
-    
-    if len(submissions) >= max_per_day:
-        return False  # Rate limit exceeded
-    
-    return True  # Under limit
+def _connect() -> sqlite3.Connection:
+    """Open the rate-limit store, creating it on first use."""
+    RATE_LIMIT_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(RATE_LIMIT_DB, timeout=RATE_LIMIT_BUSY_TIMEOUT)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS daily_counts ('
+        'email TEXT NOT NULL, day TEXT NOT NULL, count INTEGER NOT NULL, '
+        'PRIMARY KEY (email, day)) WITHOUT ROWID'
+    )
+    # Lets the 7-day cleanup delete a contiguous index range instead of scanning
+    conn.execute('CREATE INDEX IF NOT EXISTS daily_counts_day ON daily_counts (day)')
+    return conn
 
 
-def record_submission(email: str):
-    """Record submission for rate limiting."""
-    RATE_LIMIT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    if RATE_LIMIT_FILE.exists():
-        with open(RATE_LIMIT_FILE, 'r') as f:
-            rate_limits = json.load(f)
-    else:
-        rate_limits = {}
+def check_and_record(email: str, max_per_day: int = 5, record: bool = True,
+                     now: Optional[datetime] = None,
+                     conn: Optional[sqlite3.Connection] = None) -> bool:
+    """
+    Check the rate limit for email and, if under it, record this submission.
     
-    today = datetime.now().strftime('%Y-%m-%d')
+    Cleanup, count and insert run in one write transaction, so concurrent
+    validators serialize on the store. Pass record=False to only check, and
+    conn to reuse an open store (it is left open).
+    Returns True if the submission is allowed.
+    """
+    own_conn = conn is None
+    if own_conn:
+        try:
+            conn = _connect()
+        except (OSError, sqlite3.Error):
+            return True  # Store unavailable, allow
+    
+    if now is None:
+        now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    cutoff = (now - timedelta(days=7)).strftime('%Y-%m-%d')
     email_key = email.lower()
     
-    if email_key not in rate_limits:
-        rate_limits[email_key] = {}
-    
-    if today not in rate_limits[email_key]:
-        rate_limits[email_key][today] = []
-    
-    rate_limits[email_key][today].append(datetime.now().isoformat())
-    
-    # Clean up old entries (older than 7 days)
-    cutoff_date = datetime.now().replace(day=datetime.now().day - 7)
-    for email_addr in list(rate_limits.keys()):
-        for date in list(rate_limits[email_addr].keys()):
-            if datetime.strptime(date, '%Y-%m-%d') < cutoff_date:
-                del rate_limits[email_addr][date]
-        if not rate_limits[email_addr]:
-            del rate_limits[email_addr]
+    try:
+        with conn:
+            # Take the write lock up front so parallel runs can't both count
+            # under the limit and then both insert
+            conn.execute('BEGIN IMMEDIATE')
+            
+            # Clean up old entries (older than 7 days); ISO dates sort as strings
+            conn.execute('DELETE FROM daily_counts WHERE day < ?', (cutoff,))
+            
+            row = conn.execute(
+                'SELECT count FROM daily_counts WHERE email = ? AND day = ?',
+                (email_key, today),
+            ).fetchone()
+            if row is not None and row[0] >= max_per_day:
+                return False  # Rate limit exceeded
+            
+            if record:
+                conn.execute(
+                    'INSERT INTO daily_counts (email, day, count) VALUES (?, ?, 1) '
+                    'ON CONFLICT (email, day) DO UPDATE SET count = count + 1',
+                    (email_key, today),
+                )
+    except sqlite3.Error:
+        return True  # Store unavailable, allow
+    finally:
+        if own_conn:
+            conn.close()
     
-    with open(RATE_LIMIT_FILE, 'w') as f:
-        json.dump(rate_limits, f, indent=2)
+    return True  # Under limit
 
 
-def validate_email(email: str) -> tuple[bool, str]:
-    """Validate email format and provider."""
+def validate_email(email: str) -> str:
+    """Validate email format and provider. Returns an error message, or "" if valid."""
     if not email:
-        return False, "Email is required"
+        return "Email is required"
     
-    if not re.match(r'^[^@]+@[^@]+\.[^@]+$', email):
-        return False, "Invalid email format"
+    if not isinstance(email, str) or not _EMAIL_RE.match(email):
+        return "Invalid email format"
     
     if is_disposable_email(email):
-        return False, "Disposable email providers are not allowed"
+        return "Disposable email providers are not allowed"
     
-    return True, ""
+    return ""
 
 
-def validate_age(age: int) -> tuple[bool, str]:
-    """Validate age."""
+def validate_age(age: int) -> str:
+    """Validate age. Returns an error message, or "" if valid."""
     if age and (age < 18 or age > 99):
-        return False, "Age must be between 18 and 99"
-    return True, ""
+        return "Age must be between 18 and 99"
+    return ""
 
 
-def validate_weekly_hours(hours: int) -> tuple[bool, str]:
-    """Validate weekly training hours."""
+def validate_weekly_hours(hours: int) -> str:
+    """Validate weekly training hours. Returns an error message, or "" if valid."""
     if hours and (hours < 0 or hours > 40):
-        return False, "Weekly hours must be between 0 and 40"
-    return True, ""
+        return "Weekly hours must be between 0 and 40"
+    return ""
 
 
 def validate_required_fields(data: Dict) -> tuple[bool, List[str]]:
     """Validate all required fields are present."""
     errors = []
     
-    required = ['name', 'email', 'primary_goal']
-    
-    for field in required:
+    for field in _REQUIRED_FIELDS:
         if not data.get(field):
             errors.append(f"Missing required field: {field}")
     
@@ -140,47 +218,43 @@ def validate_required_fields(data: Dict) -> tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
-def validate_schedule(data: Dict) -> tuple[bool, str]:
-    """Validate at least 3 days available for training."""
-    days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    available_days = 0
-    
-    for day in days:
-        if data.get(f'{day}_available'):
-            available_days += 1
+def validate_schedule(data: Dict) -> str:
+    """Validate at least 3 days available for training. Returns an error message, or "" if valid."""
+    available_days = sum(1 for key in _DAY_AVAIL_KEYS if data.get(key))
     
     if available_days < 3:
-        return False, "At least 3 days per week must be available for training"
+        return "At least 3 days per week must be available for training"
     
-    return True, ""
+    return ""
 
 
-def validate_submission(email: str, data_str: str) -> tuple[bool, List[str]]:
+def validate_submission(email: str, data_str: str,
+                        conn: Optional[sqlite3.Connection] = None) -> tuple[bool, List[str]]:
     """
     Validate athlete submission.
     
+    conn is an open rate-limit store to reuse; by default one is opened per call.
+    
     Returns: (is_valid, errors)
     """
     errors = []
+    now = datetime.now()  # One clock read per submission
     
     # Parse data
     try:
         if data_str:
-            data = json.loads(data_str) if isinstance(data_str, str) else data_str
+            data = _json_loads(data_str) if isinstance(data_str, str) else data_str
         else:
             data = {}
     except json.JSONDecodeError:
         return False, ["Invalid JSON data"]
+    if not isinstance(data, dict):
+        return False, ["Form data must be a JSON object"]
     
     # Validate email
-    email_valid, email_error = validate_email(email)
-    if not email_valid:
+    if email_error := validate_email(email):
         errors.append(email_error)
     
-    # Check rate limit
-    if not check_rate_limit(email):
-        errors.append("Rate limit exceeded. Maximum 5 submissions per day.")
-    
     # Validate required fields
     required_valid, required_errors = validate_required_fields(data)
     if not required_valid:
@@ -188,47 +262,98 @@ def validate_submission(email: str, data_str: str) -> tuple[bool, List[str]]:
     
     # Validate age
     if 'age' in data and data['age']:
-        age_valid, age_error = validate_age(int(data['age']))
-        if not age_valid:
-            errors.append(age_error)
+        try:
+            age = int(data['age'])
+        except (TypeError, ValueError):
+            errors.append("Age must be a number")
+        else:
+            if age_error := validate_age(age):
+                errors.append(age_error)
     
     # Validate weekly hours
     if 'weekly_volume' in data:
-        # Parse volume range (e.g., "9-12" -> use max)
+        # Parse volume range (e.g., "9-12" -> use max, "20+" -> 40)
         volume = data['weekly_volume']
-        if isinstance(volume, str) and '-' in volume:
-            max_hours = int(volume.split('-')[1]) if volume.split('-')[1] else 40
-        elif isinstance(volume, str) and volume.endswith('+'):
-            max_hours = 40
-        else:
-            max_hours = int(volume) if volume else 0
+        max_hours = None
+        if not volume:
+            max_hours = 0
+        elif isinstance(volume, (int, float)) and not isinstance(volume, bool):
+            max_hours = int(volume)  # Plain number of hours from a JSON client
+        elif match := _VOLUME_RE.match(str(volume).strip()):
+            max_hours = 40 if match.group(3) else int(match.group(2) or match.group(1))
         
-        hours_valid, hours_error = validate_weekly_hours(max_hours)
-        if not hours_valid:
+        if max_hours is None:
+            errors.append("Weekly volume must be hours like 10, 9-12 or 20+")
+        elif hours_error := validate_weekly_hours(max_hours):
             errors.append(hours_error)
     
     # Validate schedule
-    schedule_valid, schedule_error = validate_schedule(data)
-    if not schedule_valid:
+    if schedule_error := validate_schedule(data):
         errors.append(schedule_error)
     
-    # If all valid, record submission
-    if not errors:
-        record_submission(email)
+    # Check rate limit, recording the submission only if everything else passed.
+    # A malformed email can't be recorded anyway, so don't open the store for it.
+    if not email_error and not check_and_record(email, record=not errors, now=now, conn=conn):
+        errors.append("Rate limit exceeded. Maximum 5 submissions per day.")
     
     return len(errors) == 0, errors
 
 
+def validate_batch(lines, out) -> bool:
+    """
+    Validate one JSON submission per line, writing one JSON result per line.
+    
+    All submissions share a single rate-limit store connection.
+    Returns True if every submission was valid.
+    """
+    try:
+        conn = _connect()
+    except (OSError, sqlite3.Error):
+        conn = None  # Store unavailable; each check falls back on its own
+    
+    all_valid = True
+    try:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                submission = _json_loads(line)
+            except json.JSONDecodeError:
+                submission = None
+            if not isinstance(submission, dict):
+                is_valid, errors, email = False, ["Invalid JSON data"], None
+            else:
+                email = str(submission.get('email') or '')
+                try:
+                    is_valid, errors = validate_submission(email, submission.get('data'), conn=conn)
+                except Exception as e:  # One bad record mustn't end the batch
+                    is_valid, errors = False, [f"Validation error: {e}"]
+            all_valid = all_valid and is_valid
+            out.write(json.dumps({'email': email, 'valid': is_valid, 'errors': errors}) + '\n')
+    finally:
+        if conn is not None:
+            conn.close()
+    
+    return all_valid
+
+
 def main():
     """Main entry point."""
     import argparse
     
     parser = argparse.ArgumentParser(description='Validate athlete submission')
-    parser.add_argument('--email', required=True, help='Athlete email')
-    parser.add_argument('--data', required=True, help='Form data as JSON string')
+    parser.add_argument('--email', help='Athlete email')
+    parser.add_argument('--data', help='Form data as JSON string')
+    parser.add_argument('--batch', action='store_true',
+                        help='Read {"email": ..., "data": ...} JSON lines from stdin')
     
     args = parser.parse_args()
     
+    if args.batch:
+        sys.exit(0 if validate_batch(sys.stdin, sys.stdout) else 1)
+    if args.email is None or args.data is None:
+        parser.error('--email and --data are required unless --batch is given')
+    
     is_valid, errors = validate_submission(args.email, args.data)
     
     if not is_valid:
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Tests for the HTML training guide generator"""
+
+import sys
+from pathlib import Path
+import pytest
+import yaml
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "athletes" / "scripts"))
+
+import generate_html_guide as gh  # noqa: E402
+
+PROFILE = {
+    "name": "Test Rider",
+    "birthday": "1986-01-15",
+    "target_race": {"name": "Unbound 200", "date": "2026-06-07", "goal_type": "compete"},
+}
+DERIVED = {"tier": "compete", "plan_weeks": 12, "strength_frequency": 2}
+
+
+@pytest.fixture
+def athletes(tmp_path, monkeypatch):
+    """Write athlete dirs under a tmp cwd; the generator reads athletes/<id>/."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(gh, "_PARSE_CACHE", {})
+
+    def make(athlete_id="test-athlete", profile=None, derived=None, weekly_structure=None):
+        base = tmp_path / "athletes" / athlete_id
+        base.mkdir(parents=True)
+        (base / "profile.yaml").write_text(yaml.safe_dump(PROFILE if profile is None else profile))
+        (base / "derived.yaml").write_text(yaml.safe_dump(DERIVED if derived is None else derived))
+        if weekly_structure is not None:
+            (base / "weekly_structure.yaml").write_text(yaml.safe_dump(weekly_structure))
+        return athlete_id
+
+    return make
+
+
+def expected_age(year, month, day):
+    now = gh._NOW
+    return now.year - year - ((now.month, now.day) < (month, day))
+
+
+class TestAge:
+    @pytest.mark.parametrize("birthday, expected", [
+        ("1986-01-15", expected_age(1986, 1, 15)),
+        ("1960-12-31", expected_age(1960, 12, 31)),
+    ])
+    def test_valid_birthday(self, athletes, birthday, expected):
+        aid = athletes(profile=dict(PROFILE, birthday=birthday))
+        assert gh.GuideGenerator(aid)._age == expected
+
+    @pytest.mark.parametrize("birthday", [
+        "1960-02-30",
+        "1986-13-45",
+        "1986-1-5",
+        "1986-00-10",
+        "+986-01-15",
+        "1986-01- 5",
+        "1986_01_15",
+        "1986/01/15",
+        "not a date",
+        19860115,
+        None,
+    ])
+    def test_invalid_birthday_has_no_age(self, athletes, birthday):
+        aid = athletes(profile=dict(PROFILE, birthday=birthday))
+        generator = gh.GuideGenerator(aid)
+        assert generator._age is None
+        assert not generator._is_masters()
+
+    def test_impossible_date_gets_no_masters_section(self, athletes):
+        aid = athletes(profile=dict(PROFILE, birthday="1960-02-30"))
+        html = gh.GuideGenerator(aid).generate()
+        assert 'id="masters"' not in html
+
+    def test_masters_section_for_fifty_plus(self, athletes):
+        aid = athletes(profile=dict(PROFILE, birthday="1960-01-15"))
+        generator = gh.GuideGenerator(aid)
+        assert generator._is_masters()
+        assert 'id="masters"' in generator.generate()
+
+
+PAYLOAD = "<script>alert(1)</script>&"
+ESCAPED = "&lt;script&gt;alert(1)&lt;/script&gt;&amp;"
+
+
+def block(html, start, end):
+    """The first slice of html from start up to the following end."""
+    i = html.index(start)
+    return html[i:html.index(end, i)]
+
+
+class TestEscaping:
+    @pytest.fixture
+    def html(self, athletes):
+        profile = dict(PROFILE, name="Ann" + PAYLOAD, target_race=dict(
+            PROFILE["target_race"], name="Race" + PAYLOAD, notes="Notes" + PAYLOAD))
+        days = {d: {"am": "easy_ride", "pm": None, "is_key_day": False, "notes": ""}
+                for d in gh._WEEKDAYS}
+        days["monday"].update(pm="Spin" + PAYLOAD, notes="Day" + PAYLOAD)
+        days["tuesday"]["notes"] = 1234  # Non-string YAML scalars still render
+        aid = athletes(profile=profile, weekly_structure={"days": days})
+        return gh.GuideGenerator(aid).generate()
+
+    def test_no_raw_markup(self, html):
+        assert "<script>alert" not in html.lower()
+
+    @pytest.mark.parametrize("start, end, text", [
+        ("<title>", "</title>", "Race"),
+        ("<title>", "</title>", "Ann"),
+        ('<header class="guide-header">', "</header>", "Race"),
+        ('<header class="guide-header">', "</header>", "Ann"),
+        ('<nav class="toc">', "</nav>", "Race"),
+        ('<section id="quick-reference">', "</section>", "Race"),
+        ('<section id="race-timeline">', "</section>", "Race"),
+        ('<section id="race-timeline">', "</section>", "Notes"),
+        ('<section id="race-tactics">', "</section>", "Race"),
+        ('<section id="atp">', "</section>", "Spin"),
+        ('<section id="your-schedule">', "</section>", "Spin"),
+        ('<section id="your-schedule">', "</section>", "Day"),
+        ('<footer class="guide-footer">', "</footer>", "Ann"),
+    ])
+    def test_field_escaped_in_section(self, html, start, end, text):
+        assert text + ESCAPED in block(html, start, end)
+
+    def test_non_string_schedule_value(self, html):
+        assert "<td>1234</td>" in block(html, '<section id="your-schedule">', "</section>")
+
+
+class TestGenerateMany:
+    def test_failure_reported_separately(self, athletes):
+        aid = athletes()
+        guides, failures = gh.generate_many([aid, "no-such-athlete"])
+        assert list(guides) == [aid]
+        assert guides[aid] == gh.GuideGenerator(aid).generate()
+        assert list(failures) == ["no-such-athlete"]
+        assert isinstance(failures["no-such-athlete"], FileNotFoundError)
+
+    def test_empty(self):
+        assert gh.generate_many([]) == ({}, {})
+
+
+def week(key_days=(), pm_days=()):
+    return {"days": {d: {"am": "easy_ride", "pm": "strength" if d in pm_days else None,
+                         "is_key_day": d in key_days, "notes": ""}
+                     for d in gh._WEEKDAYS}}
+
+
+class TestConditionalContent:
+    RECOVERY = "<h4>Post-Workout Recovery</h4>"
+    PM_BRANCH = "PM Session"
+
+    def test_no_weekly_structure(self, athletes):
+        generator = gh.GuideGenerator(athletes())
+        html = generator.generate()
+        assert generator.needs_recovery_nutrition and self.RECOVERY in html
+        assert not generator.has_pm_sessions and self.PM_BRANCH not in html
+
+    @pytest.mark.parametrize("key_days", [(), ("saturday",)])
+    def test_recovery_omitted_below_two_key_days(self, athletes, key_days):
+        generator = gh.GuideGenerator(athletes(weekly_structure=week(key_days)))
+        assert not generator.needs_recovery_nutrition
+        assert self.RECOVERY not in generator.generate()
+
+    @pytest.mark.parametrize("key_days", [
+        ("tuesday", "saturday"),
+        ("monday", "wednesday", "friday"),
+    ])
+    def test_recovery_kept_for_two_or_more_key_days(self, athletes, key_days):
+        generator = gh.GuideGenerator(athletes(weekly_structure=week(key_days)))
+        assert generator.needs_recovery_nutrition
+        assert self.RECOVERY in generator.generate()
+
+    def test_pm_branch_only_with_pm_sessions(self, athletes):
+        am_only = gh.GuideGenerator(athletes("am-only", weekly_structure=week()))
+        assert self.PM_BRANCH not in am_only.generate()
+        with_pm = gh.GuideGenerator(athletes("with-pm", weekly_structure=week(pm_days=("thursday",))))
+        assert with_pm.has_pm_sessions
+        assert self.PM_BRANCH in with_pm.generate()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Tests for the submission validator's rate-limit store and batch mode"""
+
+import io
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "athletes" / "scripts"))
+
+import validate_submission as vs  # noqa: E402
+
+EMAIL = "rider@example.com"
+VALID_DATA = {
+    "name": "Test Rider",
+    "email": EMAIL,
+    "primary_goal": "specific_race",
+    "race_name": "Unbound",
+    "race_date": "2026-06-01",
+    "monday_available": True,
+    "wednesday_available": True,
+    "saturday_available": True,
+    "weekly_volume": "9-12",
+    "age": 40,
+}
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_db(tmp_path, monkeypatch):
+    db = tmp_path / "rate-limits.sqlite3"
+    monkeypatch.setattr(vs, "RATE_LIMIT_DB", db)
+    return db
+
+
+def stored_days(email):
+    conn = vs._connect()
+    try:
+        return conn.execute(
+            "SELECT day, count FROM daily_counts WHERE email = ? ORDER BY day", (email,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestRateLimit:
+    def test_sixth_submission_rejected(self):
+        data = json.dumps(VALID_DATA)
+        results = [vs.validate_submission(EMAIL, data) for _ in range(6)]
+        assert [ok for ok, _ in results] == [True] * 5 + [False]
+        assert "Rate limit exceeded" in results[-1][1][0]
+
+    def test_limit_is_per_email_case_insensitive(self):
+        for _ in range(5):
+            assert vs.check_and_record(EMAIL.upper())
+        assert not vs.check_and_record(EMAIL)
+        assert vs.check_and_record("other@example.com")
+
+    def test_check_only_does_not_count(self):
+        for _ in range(10):
+            assert vs.check_and_record(EMAIL, record=False)
+        assert stored_days(EMAIL) == []
+
+    def test_invalid_submission_not_recorded(self):
+        ok, _ = vs.validate_submission(EMAIL, json.dumps({"name": "No Goal"}))
+        assert not ok
+        assert stored_days(EMAIL) == []
+
+    def test_old_days_pruned(self):
+        now = datetime(2026, 3, 3, 12, 0)
+        vs.check_and_record(EMAIL, now=now - timedelta(days=10))
+        vs.check_and_record(EMAIL, now=now - timedelta(days=3))
+        vs.check_and_record(EMAIL, now=now)
+        assert stored_days(EMAIL) == [("2026-02-28", 1), ("2026-03-03", 1)]
+
+    def test_unreadable_store_allows(self, rate_limit_db):
+        rate_limit_db.write_text("not a database")
+        assert vs.check_and_record(EMAIL)
+
+
+class TestBatch:
+    def run_batch(self, records):
+        lines = io.StringIO("".join(
+            (r if isinstance(r, str) else json.dumps(r)) + "\n" for r in records
+        ))
+        out = io.StringIO()
+        all_valid = vs.validate_batch(lines, out)
+        return all_valid, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_all_valid(self):
+        all_valid, results = self.run_batch([{"email": EMAIL, "data": VALID_DATA}] * 2)
+        assert all_valid
+        assert [r["valid"] for r in results] == [True, True]
+
+    def test_bad_lines_do_not_abort(self):
+        all_valid, results = self.run_batch([
+            {"email": EMAIL, "data": VALID_DATA},
+            "not json",
+            {"email": EMAIL, "data": [1]},
+            {"email": EMAIL, "data": dict(VALID_DATA, age="thirty")},
+            {"email": "second@example.com", "data": VALID_DATA},
+        ])
+        assert not all_valid
+        assert [r["valid"] for r in results] == [True, False, False, False, True]
+        assert results[1]["errors"] == ["Invalid JSON data"]
+        assert results[2]["errors"] == ["Form data must be a JSON object"]
+        assert "Age must be a number" in results[3]["errors"]
+
+    def test_unexpected_error_reported_per_line(self, monkeypatch):
+        real = vs.validate_submission
+
+        def flaky(email, data, conn=None):
+            if email == "boom@example.com":
+                raise RuntimeError("boom")
+            return real(email, data, conn=conn)
+
+        monkeypatch.setattr(vs, "validate_submission", flaky)
+        all_valid, results = self.run_batch([
+            {"email": "boom@example.com", "data": VALID_DATA},
+            {"email": EMAIL, "data": VALID_DATA},
+        ])
+        assert not all_valid
+        assert results[0] == {"email": "boom@example.com", "valid": False,
+                              "errors": ["Validation error: boom"]}
+        assert results[1]["valid"]
+        assert stored_days(EMAIL)[0][1] == 1
+
+
+class TestWeeklyVolume:
+    VOLUME_ERROR = "Weekly volume must be hours like 10, 9-12 or 20+"
+
+    @pytest.mark.parametrize("volume", ["10", "9-12", "20+", " 10", "9-12 ", 10, 10.5, "", None])
+    def test_accepted(self, volume):
+        ok, errors = vs.validate_submission(EMAIL, json.dumps(dict(VALID_DATA, weekly_volume=volume)))
+        assert ok, errors
+
+    @pytest.mark.parametrize("volume, error", [
+        ("9-", VOLUME_ERROR),
+        ("abc", VOLUME_ERROR),
+        ("-5", VOLUME_ERROR),
+        (True, VOLUME_ERROR),
+        ("45", "Weekly hours must be between 0 and 40"),
+        ("30-45", "Weekly hours must be between 0 and 40"),
+        (41, "Weekly hours must be between 0 and 40"),
+    ])
+    def test_rejected(self, volume, error):
+        ok, errors = vs.validate_submission(EMAIL, json.dumps(dict(VALID_DATA, weekly_volume=volume)))
+        assert not ok
+        assert errors == [error]
+
+
+class TestDisposableEmail:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        vs.is_disposable_email.cache_clear()
+        yield
+        vs.is_disposable_email.cache_clear()
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        domains = [f"disposable-{i}.example" for i in range(5000)]
+        bloom = vs._BloomFilter(domains)
+        assert all(domain in bloom for domain in domains)
+        false_positives = sum(f"legit-{i}.example" in bloom for i in range(5000))
+        assert false_positives < 5000 * 0.03
+
+    def test_exact_set_without_bloom(self):
+        assert vs._DISPOSABLE_BLOOM is None  # Too few domains to build one
+        assert vs.is_disposable_email("someone@Mailinator.com")
+        assert not vs.is_disposable_email("someone@example.com")
+        assert not vs.is_disposable_email("not-an-email")
+
+    def test_bloom_hit_falls_through_to_exact_set(self, monkeypatch):
+        monkeypatch.setattr(vs, "_DISPOSABLE_BLOOM", vs._BloomFilter(vs.DISPOSABLE_EMAIL_PROVIDERS))
+        assert vs.is_disposable_email("someone@mailinator.com")
+        assert not vs.is_disposable_email("someone@example.com")
+
+        class AlwaysHit:
+            def __contains__(self, item):
+                return True
+
+        # A false positive from the filter must not flag a legitimate domain
+        vs.is_disposable_email.cache_clear()
+        monkeypatch.setattr(vs, "_DISPOSABLE_BLOOM", AlwaysHit())
+        assert not vs.is_disposable_email("someone@example.com")
+        assert vs.is_disposable_email("someone@maildrop.cc")